@@ -70,7 +70,7 @@ class TLTServiceClient:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
                 response = await client.post(
                     f"{self.base_url}/cloudevents",
-                    json=cloud_event.model_dump(),
+                    content=cloud_event.to_json_bytes(),
                     headers={"Content-Type": "application/json"}
                 )
                 response.raise_for_status()
@@ -118,7 +118,7 @@ class TLTServiceClient:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
                 response = await client.post(
                     f"{self.base_url}/cloudevents",
-                    json=cloud_event.model_dump(),
+                    content=cloud_event.to_json_bytes(),
                     headers={"Content-Type": "application/json"}
                 )
                 response.raise_for_status()
@@ -166,7 +166,7 @@ class TLTServiceClient:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
                 response = await client.post(
                     f"{self.base_url}/cloudevents",
-                    json=cloud_event.model_dump(),
+                    content=cloud_event.to_json_bytes(),
                     headers={"Content-Type": "application/json"}
                 )
                 response.raise_for_status()
@@ -212,7 +212,7 @@ class TLTServiceClient:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
                 response = await client.post(
                     f"{self.base_url}/cloudevents",
-                    json=cloud_event.model_dump(),
+                    content=cloud_event.to_json_bytes(),
                     headers={"Content-Type": "application/json"}
                 )
                 response.raise_for_status()
@@ -259,7 +259,7 @@ class TLTServiceClient:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
                 response = await client.post(
                     f"{self.base_url}/cloudevents",
-                    json=cloud_event.model_dump(),
+                    content=cloud_event.to_json_bytes(),
                     headers={"Content-Type": "application/json"}
                 )
                 response.raise_for_status()
@@ -306,7 +306,7 @@ class TLTServiceClient:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
                 response = await client.post(
                     f"{self.base_url}/cloudevents",
-                    json=cloud_event.model_dump(),
+                    content=cloud_event.to_json_bytes(),
                     headers={"Content-Type": "application/json"}
                 )
                 response.raise_for_status()
@@ -349,7 +349,7 @@ class TLTServiceClient:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
                 response = await client.post(
                     f"{self.base_url}/cloudevents",
-                    json=cloud_event.model_dump(),
+                    content=cloud_event.to_json_bytes(),
                     headers={"Content-Type": "application/json"}
                 )
                 response.raise_for_status()
@@ -394,7 +394,7 @@ class TLTServiceClient:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
                 response = await client.post(
                     f"{self.base_url}/cloudevents",
-                    json=cloud_event.model_dump(),
+                    content=cloud_event.to_json_bytes(),
                     headers={"Content-Type": "application/json"}
                 )
                 response.raise_for_status()
@@ -439,7 +439,7 @@ class TLTServiceClient:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
                 response = await client.post(
                     f"{self.base_url}/cloudevents",
-                    json=cloud_event.model_dump(),
+                    content=cloud_event.to_json_bytes(),
                     headers={"Content-Type": "application/json"}
                 )
                 response.raise_for_status()
@@ -490,7 +490,7 @@ class TLTServiceClient:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
                 response = await client.post(
                     f"{self.base_url}/cloudevents",
-                    json=cloud_event.model_dump(),
+                    content=cloud_event.to_json_bytes(),
                     headers={"Content-Type": "application/json"}
                 )
                 response.raise_for_status()
@@ -545,7 +545,7 @@ class TLTServiceClient:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
                 response = await client.post(
                     f"{self.base_url}/cloudevents",
-                    json=cloud_event.model_dump(),
+                    content=cloud_event.to_json_bytes(),
                     headers={"Content-Type": "application/json"}
                 )
                 response.raise_for_status()
@@ -594,7 +594,7 @@ class TLTServiceClient:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
                 response = await client.post(
                     f"{self.base_url}/cloudevents",
-                    json=cloud_event.model_dump(),
+                    content=cloud_event.to_json_bytes(),
                     headers={"Content-Type": "application/json"}
                 )
                 response.raise_for_status()
@@ -654,7 +654,7 @@ class TLTServiceClient:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
                 response = await client.post(
                     f"{self.base_url}/cloudevents",
-                    json=cloud_event.model_dump(),
+                    content=cloud_event.to_json_bytes(),
                     headers={"Content-Type": "application/json"}
                 )
                 response.raise_for_status()
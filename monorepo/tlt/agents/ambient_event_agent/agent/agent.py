@@ -44,6 +44,7 @@ class AmbientEventAgent:
         # State management
         self.checkpointer = MemorySaver()
         self.current_state = None
+        self.state_version = 0  # Bumped whenever current_state is replaced or mutated here
         
         # Create the graph
         self.graph = self._create_graph()
@@ -141,6 +142,7 @@ class AmbientEventAgent:
             raise
         
         self.current_state = result
+        self.state_version += 1
         return result
     
     async def run_single_cycle(self) -> AgentState:
@@ -157,6 +159,7 @@ class AmbientEventAgent:
         result = await self.graph.ainvoke(self.current_state, config=config)
         
         self.current_state = result
+        self.state_version += 1
         return result
     
     async def run_continuous(self, max_iterations: int = None, sleep_interval: float = 5.0):
@@ -213,6 +216,7 @@ class AmbientEventAgent:
                             "error": str(e),
                             "iteration": iteration
                         })
+                        self.state_version += 1
                     
                     # Try to recover
                     await asyncio.sleep(sleep_interval * 2)  # Wait longer on error
@@ -235,6 +239,7 @@ class AmbientEventAgent:
         """Stop the agent gracefully"""
         if self.current_state:
             self.current_state["status"] = AgentStatus.STOPPING
+            self.state_version += 1
             logger.info(f"Agent {self.agent_id} stopping")
     
     def _log_status(self):
@@ -344,6 +349,7 @@ class AmbientEventAgent:
         
         logger.info(f"incoming_event: {pprint.pformat(incoming_event.model_dump(), indent=2, compact=False)}")
         self.current_state["pending_events"].append(incoming_event)
+        self.state_version += 1
         logger.info(f"Event added to pending queue: {incoming_event.event_id}")
     
     def schedule_timer(self, event_id: str, timer_type: str, scheduled_time: datetime, priority: str = "normal"):
@@ -361,6 +367,7 @@ class AmbientEventAgent:
         )
         
         self.current_state["active_timers"].append(timer)
+        self.state_version += 1
         logger.info(f"Scheduled {timer_type} timer for event {event_id} at {scheduled_time}")
     
     def get_metrics(self) -> Dict[str, Any]:
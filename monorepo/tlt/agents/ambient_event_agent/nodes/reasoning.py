@@ -435,6 +435,7 @@ Use the AgentReasoningDecision tool to provide your structured decision."""
         if decision.decision_type == "send_message":
             if decision.message_content and decision.channel_id:
                 message = MessageToSend(
+                    guild_id=decision.metadata.get("guild_id"),
                     channel_id=decision.channel_id,
                     content=decision.message_content,
                     priority=MessagePriority(decision.priority),
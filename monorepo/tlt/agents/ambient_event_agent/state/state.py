@@ -120,6 +120,7 @@ class AgentDecision(BaseModel):
 class MessageToSend(BaseModel):
     """Represents a message to be sent"""
     message_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    guild_id: Optional[str] = None
     channel_id: str
     content: str
     priority: MessagePriority = MessagePriority.NORMAL
@@ -51,14 +51,16 @@ def register_tools(mcp: FastMCP, service: GuildManagerService):
                 logger.info(f"Guild registered successfully: {guild_id} ({guild_name}) by {user_id} ({user_name})")
                 
                 # Update event.json with guild registration
-                event_state_manager.update_nested_field(guild_id, "guild_registration", "guild_registered", True)
-                event_state_manager.update_nested_field(guild_id, "guild_registration", "guild_name", guild_name)
-                event_state_manager.update_nested_field(guild_id, "guild_registration", "channel_id", channel_id)
-                event_state_manager.update_nested_field(guild_id, "guild_registration", "channel_name", channel_name)
-                event_state_manager.update_nested_field(guild_id, "guild_registration", "registered_by", {
-                    "user_id": user_id,
-                    "user_name": user_name
-                })
+                await event_state_manager.apply_updates_async(guild_id, "guild_registration", [
+                    ("nested", "guild_registered", True),
+                    ("nested", "guild_name", guild_name),
+                    ("nested", "channel_id", channel_id),
+                    ("nested", "channel_name", channel_name),
+                    ("nested", "registered_by", {
+                        "user_id": user_id,
+                        "user_name": user_name
+                    }),
+                ], fsync=True)
             else:
                 logger.error(f"Failed to register guild {guild_id}: {result.get('error', 'Unknown error')}")
             
@@ -75,7 +77,7 @@ def register_tools(mcp: FastMCP, service: GuildManagerService):
                 metadata=metadata,
                 error=result.get('error')
             )
-            user_state_manager.add_model_entry(guild_id, "guild_registration", user_id, register_result)
+            await user_state_manager.add_model_entry_async(guild_id, "guild_registration", user_id, register_result)
             
             return result
             
@@ -99,7 +101,7 @@ def register_tools(mcp: FastMCP, service: GuildManagerService):
                     user_name=user_name,
                     metadata=metadata
                 )
-                user_state_manager.add_model_entry(guild_id, "guild_registration", user_id, register_result)
+                await user_state_manager.add_model_entry_async(guild_id, "guild_registration", user_id, register_result)
             except Exception as state_error:
                 logger.error(f"Failed to save error state: {state_error}")
             
@@ -127,16 +129,18 @@ def register_tools(mcp: FastMCP, service: GuildManagerService):
                 logger.info(f"Guild deregistered successfully: {guild_id} ({guild_name}) by {user_id} ({user_name})")
                 
                 # Update event.json with guild deregistration
-                event_state_manager.update_nested_field(guild_id, "guild_registration", "guild_registered", False)
-                event_state_manager.update_nested_field(guild_id, "guild_registration", "deregistered_by", {
-                    "user_id": user_id,
-                    "user_name": user_name
-                })
-                event_state_manager.append_to_array_field(guild_id, "guild_registration", "deregistration_history", {
-                    "user_id": user_id,
-                    "user_name": user_name,
-                    "deregistered_at": result.get('timestamp', 'unknown')
-                })
+                await event_state_manager.apply_updates_async(guild_id, "guild_registration", [
+                    ("nested", "guild_registered", False),
+                    ("nested", "deregistered_by", {
+                        "user_id": user_id,
+                        "user_name": user_name
+                    }),
+                    ("append", "deregistration_history", {
+                        "user_id": user_id,
+                        "user_name": user_name,
+                        "deregistered_at": result.get('timestamp', 'unknown')
+                    }),
+                ], fsync=True)
             else:
                 logger.error(f"Failed to deregister guild {guild_id}: {result.get('error', 'Unknown error')}")
             
@@ -151,7 +155,7 @@ def register_tools(mcp: FastMCP, service: GuildManagerService):
                 metadata=metadata,
                 error=result.get('error')
             )
-            user_state_manager.add_model_entry(guild_id, "guild_registration", user_id, deregister_result)
+            await user_state_manager.add_model_entry_async(guild_id, "guild_registration", user_id, deregister_result)
             
             return result
             
@@ -173,7 +177,7 @@ def register_tools(mcp: FastMCP, service: GuildManagerService):
                     user_name=user_name,
                     metadata=metadata
                 )
-                user_state_manager.add_model_entry(guild_id, "guild_registration", user_id, deregister_result)
+                await user_state_manager.add_model_entry_async(guild_id, "guild_registration", user_id, deregister_result)
             except Exception as state_error:
                 logger.error(f"Failed to save error state: {state_error}")
             
@@ -198,7 +202,7 @@ def register_tools(mcp: FastMCP, service: GuildManagerService):
                 guild_info=result.get('guild_info'),
                 error=result.get('error')
             )
-            user_state_manager.add_model_entry(guild_id, "guild_info", "system", guild_info_result)
+            await user_state_manager.add_model_entry_async(guild_id, "guild_info", "system", guild_info_result)
             
             return result
             
@@ -216,7 +220,7 @@ def register_tools(mcp: FastMCP, service: GuildManagerService):
                     error=str(e),
                     guild_id=guild_id
                 )
-                user_state_manager.add_model_entry(guild_id, "guild_info", "system", guild_info_result)
+                await user_state_manager.add_model_entry_async(guild_id, "guild_info", "system", guild_info_result)
             except Exception as state_error:
                 logger.error(f"Failed to save error state: {state_error}")
             
@@ -243,7 +247,7 @@ def register_tools(mcp: FastMCP, service: GuildManagerService):
                 status_filter=status,
                 error=result.get('error')
             )
-            user_state_manager.add_model_entry("all_guilds", "guild_listing", "system", list_guilds_result)
+            await user_state_manager.add_model_entry_async("all_guilds", "guild_listing", "system", list_guilds_result)
             
             return result
             
@@ -261,7 +265,7 @@ def register_tools(mcp: FastMCP, service: GuildManagerService):
                     error=str(e),
                     status_filter=status
                 )
-                user_state_manager.add_model_entry("all_guilds", "guild_listing", "system", list_guilds_result)
+                await user_state_manager.add_model_entry_async("all_guilds", "guild_listing", "system", list_guilds_result)
             except Exception as state_error:
                 logger.error(f"Failed to save error state: {state_error}")
             
@@ -285,15 +289,18 @@ def register_tools(mcp: FastMCP, service: GuildManagerService):
                 logger.info(f"Guild settings updated successfully: {guild_id} by {user_id}")
                 
                 # Update event.json with guild settings
-                for setting_key, setting_value in settings.items():
-                    event_state_manager.update_nested_field(guild_id, "guild_settings", f"guild_settings.{setting_key}", setting_value)
+                updates = [
+                    ("nested", f"guild_settings.{setting_key}", setting_value)
+                    for setting_key, setting_value in settings.items()
+                ]
                 
                 # Track settings update history
-                event_state_manager.append_to_array_field(guild_id, "guild_settings", "settings_update_history", {
+                updates.append(("append", "settings_update_history", {
                     "user_id": user_id,
                     "updated_settings": settings,
                     "updated_at": result.get('timestamp', 'unknown')
-                })
+                }))
+                await event_state_manager.apply_updates_async(guild_id, "guild_settings", updates)
             else:
                 logger.error(f"Failed to update guild settings for {guild_id}: {result.get('error', 'Unknown error')}")
             
@@ -307,7 +314,7 @@ def register_tools(mcp: FastMCP, service: GuildManagerService):
                 updated_settings=result.get('updated_settings'),
                 error=result.get('error')
             )
-            user_state_manager.add_model_entry(guild_id, "guild_settings", user_id, update_settings_result)
+            await user_state_manager.add_model_entry_async(guild_id, "guild_settings", user_id, update_settings_result)
             
             return result
             
@@ -327,7 +334,7 @@ def register_tools(mcp: FastMCP, service: GuildManagerService):
                     settings=settings,
                     user_id=user_id
                 )
-                user_state_manager.add_model_entry(guild_id, "guild_settings", user_id, update_settings_result)
+                await user_state_manager.add_model_entry_async(guild_id, "guild_settings", user_id, update_settings_result)
             except Exception as state_error:
                 logger.error(f"Failed to save error state: {state_error}")
             
@@ -352,7 +359,7 @@ def register_tools(mcp: FastMCP, service: GuildManagerService):
                 stats=result.get('stats'),
                 error=result.get('error')
             )
-            user_state_manager.add_model_entry("all_guilds", "guild_stats", "system", guild_stats_result)
+            await user_state_manager.add_model_entry_async("all_guilds", "guild_stats", "system", guild_stats_result)
             
             return result
             
@@ -369,7 +376,7 @@ def register_tools(mcp: FastMCP, service: GuildManagerService):
                     success=False,
                     error=str(e)
                 )
-                user_state_manager.add_model_entry("all_guilds", "guild_stats", "system", guild_stats_result)
+                await user_state_manager.add_model_entry_async("all_guilds", "guild_stats", "system", guild_stats_result)
             except Exception as state_error:
                 logger.error(f"Failed to save error state: {state_error}")
             
@@ -121,10 +121,10 @@ def register_tools(mcp: FastMCP, service: PhotoVibeCheckService, processor: Phot
                         photo_url=photo_url,
                         metadata=metadata
                     )
-                    user_state_manager.add_model_entry(guild_id, event_id, user_id, submit_result)
+                    await user_state_manager.add_model_entry_async(guild_id, event_id, user_id, submit_result)
                     
                     # Update event.json with photo submission data
-                    event_state_manager.append_to_array_field(guild_id, event_id, "photo_submissions", {
+                    await event_state_manager.append_to_array_field_async(guild_id, event_id, "photo_submissions", {
                         "photo_id": result.photo_id,
                         "user_id": user_id,
                         "submitted_at": datetime.now(timezone.utc).isoformat(),
@@ -170,7 +170,7 @@ def register_tools(mcp: FastMCP, service: PhotoVibeCheckService, processor: Phot
                         photo_url=photo_url,
                         metadata=metadata
                     )
-                    user_state_manager.add_model_entry(event_id, event_id, user_id, submit_result)
+                    await user_state_manager.add_model_entry_async(event_id, event_id, user_id, submit_result)
                     
                     logger.info(f"Final response without vibe check: {response}")
                     return response
@@ -197,7 +197,7 @@ def register_tools(mcp: FastMCP, service: PhotoVibeCheckService, processor: Phot
                 photo_url=photo_url,
                 metadata=metadata
             )
-            user_state_manager.add_model_entry(guild_id, event_id, user_id, submit_result)
+            await user_state_manager.add_model_entry_async(guild_id, event_id, user_id, submit_result)
             
             return response
             
@@ -223,7 +223,7 @@ def register_tools(mcp: FastMCP, service: PhotoVibeCheckService, processor: Phot
                     photo_url=photo_url,
                     metadata=metadata
                 )
-                user_state_manager.add_model_entry(guild_id, event_id, user_id, submit_result)
+                await user_state_manager.add_model_entry_async(guild_id, event_id, user_id, submit_result)
             except Exception as state_error:
                 logger.error(f"Failed to save error state: {state_error}")
             
@@ -299,14 +299,15 @@ def register_tools(mcp: FastMCP, service: PhotoVibeCheckService, processor: Phot
             
             # Update event.json with photo collection settings
             if guild_id:
-                event_state_manager.update_nested_field(guild_id, event_id, "photo_collection.activated", True)
-                event_state_manager.update_nested_field(guild_id, event_id, "photo_collection.admin_user_id", admin_user_id)
-                event_state_manager.update_nested_field(guild_id, event_id, "photo_collection.rate_limit_hours", rate_limit_hours)
-                event_state_manager.update_nested_field(guild_id, event_id, "photo_collection.max_hours_after_event", max_hours_after_event)
-                if event_start_time:
-                    event_state_manager.update_nested_field(guild_id, event_id, "photo_collection.event_start_time", event_start_time)
-                if pre_event_photos:
-                    event_state_manager.update_nested_field(guild_id, event_id, "photo_collection.pre_event_photos", pre_event_photos)
+                with event_state_manager.transaction(guild_id, event_id, fsync=False):
+                    event_state_manager.update_nested_field(guild_id, event_id, "photo_collection.activated", True)
+                    event_state_manager.update_nested_field(guild_id, event_id, "photo_collection.admin_user_id", admin_user_id)
+                    event_state_manager.update_nested_field(guild_id, event_id, "photo_collection.rate_limit_hours", rate_limit_hours)
+                    event_state_manager.update_nested_field(guild_id, event_id, "photo_collection.max_hours_after_event", max_hours_after_event)
+                    if event_start_time:
+                        event_state_manager.update_nested_field(guild_id, event_id, "photo_collection.event_start_time", event_start_time)
+                    if pre_event_photos:
+                        event_state_manager.update_nested_field(guild_id, event_id, "photo_collection.pre_event_photos", pre_event_photos)
             
             return response
             
@@ -918,7 +919,7 @@ def register_tools(mcp: FastMCP, service: PhotoVibeCheckService, processor: Phot
                     message="No approved photos available for slideshow or event not found",
                     event_id=event_id
                 )
-                user_state_manager.add_model_entry(guild_id_to_use, event_id, "system", slideshow_result)
+                await user_state_manager.add_model_entry_async(guild_id_to_use, event_id, "system", slideshow_result)
                 return response
             
             # Format photos for response
@@ -960,11 +961,11 @@ def register_tools(mcp: FastMCP, service: PhotoVibeCheckService, processor: Phot
                 rejected_count=slideshow.rejected_count,
                 created_at=slideshow.created_at.isoformat()
             )
-            user_state_manager.add_model_entry(guild_id_to_use, event_id, "system", slideshow_result)
+            await user_state_manager.add_model_entry_async(guild_id_to_use, event_id, "system", slideshow_result)
             
             # Update event.json with slideshow data
             if guild_id:
-                event_state_manager.append_to_array_field(guild_id, event_id, "slideshows", {
+                await event_state_manager.append_to_array_field_async(guild_id, event_id, "slideshows", {
                     "slideshow_id": slideshow.slideshow_id,
                     "created_at": slideshow.created_at.isoformat(),
                     "photo_count": len(photos_data),
@@ -991,7 +992,7 @@ def register_tools(mcp: FastMCP, service: PhotoVibeCheckService, processor: Phot
                     error=str(e),
                     event_id=event_id
                 )
-                user_state_manager.add_model_entry(guild_id_to_use, event_id, "system", slideshow_result)
+                await user_state_manager.add_model_entry_async(guild_id_to_use, event_id, "system", slideshow_result)
             except Exception as state_error:
                 logger.error(f"Failed to save error state: {state_error}")
             
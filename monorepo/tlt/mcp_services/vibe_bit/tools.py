@@ -87,7 +87,7 @@ def register_tools(mcp: FastMCP, service: VibeBitService, renderer: CanvasRender
                     y=y,
                     metadata=metadata
                 )
-                user_state_manager.add_model_entry(guild_id, event_id, user_id, error_result)
+                await user_state_manager.add_model_entry_async(guild_id, event_id, user_id, error_result)
                 
                 return {
                     "success": False,
@@ -137,10 +137,10 @@ def register_tools(mcp: FastMCP, service: VibeBitService, renderer: CanvasRender
                     y=y,
                     metadata=metadata
                 )
-                user_state_manager.add_model_entry(guild_id, event_id, user_id, success_result)
+                await user_state_manager.add_model_entry_async(guild_id, event_id, user_id, success_result)
                 
                 # Update event.json with vibe bit placement
-                event_state_manager.append_to_array_field(guild_id, event_id, "vibe_bit_placements", {
+                await event_state_manager.append_to_array_field_async(guild_id, event_id, "vibe_bit_placements", {
                     "element_id": result.element_id,
                     "user_id": user_id,
                     "element_type": element_type,
@@ -168,7 +168,7 @@ def register_tools(mcp: FastMCP, service: VibeBitService, renderer: CanvasRender
                     y=y,
                     metadata=metadata
                 )
-                user_state_manager.add_model_entry(guild_id, event_id, user_id, failed_result)
+                await user_state_manager.add_model_entry_async(guild_id, event_id, user_id, failed_result)
             
             logger.info(f"Final response: {response}")
             return response
@@ -189,7 +189,7 @@ def register_tools(mcp: FastMCP, service: VibeBitService, renderer: CanvasRender
                 metadata=metadata
             )
             try:
-                user_state_manager.add_model_entry(guild_id, event_id, user_id, error_result)
+                await user_state_manager.add_model_entry_async(guild_id, event_id, user_id, error_result)
             except Exception as state_error:
                 logger.error(f"Failed to save error state: {state_error}")
             
@@ -446,9 +446,10 @@ def register_tools(mcp: FastMCP, service: VibeBitService, renderer: CanvasRender
             user_state_manager.add_model_entry(guild_id, event_id, admin_user_id, success_result)
             
             # Update event.json with canvas activation
-            event_state_manager.update_nested_field(guild_id, event_id, "vibe_canvas_config.activated", True)
-            event_state_manager.update_nested_field(guild_id, event_id, "vibe_canvas_config.activated_at", datetime.now(timezone.utc).isoformat())
-            event_state_manager.update_nested_field(guild_id, event_id, "vibe_canvas_config.activated_by", admin_user_id)
+            with event_state_manager.transaction(guild_id, event_id, fsync=False):
+                event_state_manager.update_nested_field(guild_id, event_id, "vibe_canvas_config.activated", True)
+                event_state_manager.update_nested_field(guild_id, event_id, "vibe_canvas_config.activated_at", datetime.now(timezone.utc).isoformat())
+                event_state_manager.update_nested_field(guild_id, event_id, "vibe_canvas_config.activated_by", admin_user_id)
             
             return {
                 "success": True,
@@ -28,6 +28,10 @@ class AmbientEventAgentManager:
         self.pending_tasks: Dict[str, AgentTask] = {}
         self.completed_tasks: Dict[str, AgentTask] = {}
         self.max_completed_tasks = 1000  # Keep last 1000 completed tasks
+        self._lock = asyncio.Lock()  # Guards pending -> completed moves
+        
+        # Last encoded GET /agent/state body, keyed by (agent, agent.state_version, running)
+        self.agent_state_body_cache: Optional[tuple] = None
         
         # Rate limiting
         self.rate_limit_requests_per_minute = 30
@@ -44,6 +48,7 @@ class AmbientEventAgentManager:
             "tasks_completed": 0,
             "tasks_failed": 0,
             "rate_limit_hits": 0,
+            "success_rate_percent": 0.0,
             "uptime_start": None
         }
         
@@ -217,17 +222,30 @@ class AmbientEventAgentManager:
             "completed_tasks": len(self.completed_tasks),
             "uptime_seconds": uptime,
             "metrics": self.metrics,
+            "agent_metrics": self.agent.get_metrics() if self.agent else {},
             "agent_id": getattr(self, 'agent_id', None),
             "agent_mode": "event_driven"
         }
     
+    async def snapshot_debug_state(self) -> Dict[str, Any]:
+        """Get a consistent snapshot of manager state for the debug endpoint"""
+        async with self._lock:
+            return {
+                "agent_id": getattr(self, 'agent_id', None),
+                "debug_mode": self.debug_mode,
+                "running": self.running,
+                "pending_tasks_count": len(self.pending_tasks),
+                "completed_tasks_count": len(self.completed_tasks),
+                "mode": "event_driven"
+            }
+    
     async def list_tasks(self, status: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
         """List tasks with optional status filter"""
         tasks = []
         
         # Add pending tasks
         for task in self.pending_tasks.values():
-            if status is None or task.status.value == status:
+            if status is None or task.status == status:
                 tasks.append(task.to_dict())
         
         # Add completed tasks (most recent first)
@@ -238,7 +256,7 @@ class AmbientEventAgentManager:
         )
         
         for task in completed_list:
-            if status is None or task.status.value == status:
+            if status is None or task.status == status:
                 tasks.append(task.to_dict())
         
         # Sort by priority and creation time, then limit
@@ -247,6 +265,12 @@ class AmbientEventAgentManager:
         
         return tasks[:limit]
     
+    def _update_success_rate(self):
+        """Recompute success rate after a task completes or fails"""
+        completed = self.metrics["tasks_completed"]
+        total_tasks = completed + self.metrics["tasks_failed"]
+        self.metrics["success_rate_percent"] = round(completed * 100.0 / total_tasks, 2)
+    
     def _check_rate_limit(self) -> bool:
         """Check if request is within rate limit"""
         now = datetime.now(timezone.utc)
@@ -313,6 +337,7 @@ class AmbientEventAgentManager:
             # Mark as completed using Pydantic model method
             task.mark_completed(result)
             self.metrics["tasks_completed"] += 1
+            self._update_success_rate()
             
             logger.info(f"Task {task.task_id} completed successfully")
             
@@ -321,22 +346,24 @@ class AmbientEventAgentManager:
             # Mark as failed using Pydantic model method
             task.mark_failed(str(e))
             self.metrics["tasks_failed"] += 1
+            self._update_success_rate()
         
         finally:
-            # Move from pending to completed
-            if task.task_id in self.pending_tasks:
-                del self.pending_tasks[task.task_id]
-            
-            self.completed_tasks[task.task_id] = task
-            
-            # Cleanup old completed tasks
-            if len(self.completed_tasks) > self.max_completed_tasks:
-                oldest_tasks = sorted(
-                    self.completed_tasks.items(),
-                    key=lambda x: x[1].updated_at
-                )
-                for task_id, _ in oldest_tasks[:-self.max_completed_tasks]:
-                    del self.completed_tasks[task_id]
+            async with self._lock:
+                # Move from pending to completed
+                if task.task_id in self.pending_tasks:
+                    del self.pending_tasks[task.task_id]
+                
+                self.completed_tasks[task.task_id] = task
+                
+                # Cleanup old completed tasks
+                if len(self.completed_tasks) > self.max_completed_tasks:
+                    oldest_tasks = sorted(
+                        self.completed_tasks.items(),
+                        key=lambda x: x[1].updated_at
+                    )
+                    for task_id, _ in oldest_tasks[:-self.max_completed_tasks]:
+                        del self.completed_tasks[task_id]
     
     async def _process_discord_message(self, task: AgentTask) -> Dict[str, Any]:
         """Process a Discord message task"""
@@ -458,6 +485,7 @@ class AmbientEventAgentManager:
                     from tlt.agents.ambient_event_agent.state.state import create_initial_state
                     current_state = create_initial_state(self.agent.agent_id)
                     self.agent.current_state = current_state
+                    self.agent.state_version += 1
                 
                 # Add to pending events using the agent's method (synchronous)
                 self.agent.add_event(event_dict)
@@ -515,6 +543,7 @@ class AmbientEventAgentManager:
                     from tlt.agents.ambient_event_agent.state.state import create_initial_state
                     current_state = create_initial_state(self.agent.agent_id)
                     self.agent.current_state = current_state
+                    self.agent.state_version += 1
                 
                 # Pass AgentTask directly to agent without transformation
                 self.agent.add_event(task)
@@ -65,7 +65,7 @@ async def handle_cloudevent(cloudevent: CloudEvent):
         
         # Construct task data payload
         task_data = {
-            "cloudevent": cloudevent.model_dump(),
+            "cloudevent": cloudevent.model_dump(mode="json"),
             "timestamp": cloudevent.time.isoformat() if cloudevent.time else None,
             "message_id": cloudevent.id,
             "event_type": cloudevent.type,
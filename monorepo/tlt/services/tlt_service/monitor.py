@@ -1,13 +1,46 @@
 """Monitoring endpoints for TLT Service"""
 
+import hashlib
+import json
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
 from loguru import logger
 
 router = APIRouter()
 
+# Per-guild state skeleton for /agent/state; copied (not rebuilt) per guild.
+# The never-populated sections are tuples so the shallow copies can share them.
+_GUILD_STATE_TMPL = {
+    "guild_info": None,
+    "pending_messages": (),
+    "event_updates": (),
+    "user_notifications": (),
+    "rsvp_predictions": None
+}
+
+# /agent/state payload when the agent has no state yet (startup or degraded mode)
+_EMPTY_AGENT_STATE_TMPL = {
+    "agent_state_available": False,
+    "agent_state_by_guild": {}
+}
+
+def _iso_now() -> str:
+    """Current UTC time as an ISO-8601 string"""
+    return datetime.now(timezone.utc).isoformat()
+
+def _health_etag(status: str, queue_size: int, uptime_seconds: Optional[float]) -> str:
+    """ETag for /health derived from status plus coarse queue-size and uptime buckets"""
+    uptime_bucket = int(uptime_seconds or 0) // 5
+    key = f"{status}|{queue_size // 10}|{uptime_bucket}".encode()
+    return f'"{hashlib.blake2b(key, digest_size=8).hexdigest()}"'
+
+# The response models below are filled from AmbientEventAgentManager output
+# (get_status, AgentTask.to_dict, list_tasks), which already has the declared
+# shapes, so handlers build them with model_construct() and skip validation.
+
 class TaskStatusResponse(BaseModel):
     """Response model for task status"""
     task_id: str
@@ -30,6 +63,16 @@ class ServiceStatusResponse(BaseModel):
     metrics: Dict[str, Any]
     agent_metrics: Dict[str, Any]
 
+class ListTasksParams:
+    """Query parameters for listing tasks, injected with Depends()"""
+    def __init__(
+        self,
+        status: Optional[str] = Query(None, description="Filter by task status"),
+        limit: int = Query(50, ge=1, le=500, description="Maximum number of tasks to return")
+    ):
+        self.status = status
+        self.limit = limit
+
 class TaskListResponse(BaseModel):
     """Response model for task list"""
     tasks: List[Dict[str, Any]]
@@ -47,10 +90,10 @@ async def get_service_status():
             raise HTTPException(status_code=503, detail="Agent manager not initialized")
         
         status = await agent_manager.get_status()
-        return ServiceStatusResponse(**status)
+        return ServiceStatusResponse.model_construct(**status)
         
     except Exception as e:
-        logger.error(f"Error getting service status: {e}")
+        logger.error("Error getting service status: {}", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/tasks/{task_id}", response_model=TaskStatusResponse)
@@ -67,19 +110,16 @@ async def get_task_status(task_id: str):
         if not task_status:
             raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
         
-        return TaskStatusResponse(**task_status)
+        return TaskStatusResponse.model_construct(**task_status)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting task status for {task_id}: {e}")
+        logger.error("Error getting task status for {}: {}", task_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/tasks", response_model=TaskListResponse)
-async def list_tasks(
-    status: Optional[str] = Query(None, description="Filter by task status"),
-    limit: int = Query(50, ge=1, le=500, description="Maximum number of tasks to return")
-):
+async def list_tasks(params: ListTasksParams = Depends()):
     """List tasks with optional filtering"""
     try:
         from tlt.services.tlt_service.main import agent_manager
@@ -87,26 +127,30 @@ async def list_tasks(
         if not agent_manager:
             raise HTTPException(status_code=503, detail="Agent manager not initialized")
         
-        tasks = await agent_manager.list_tasks(status=status, limit=limit)
+        tasks = await agent_manager.list_tasks(status=params.status, limit=params.limit)
         
-        return TaskListResponse(
+        return TaskListResponse.model_construct(
             tasks=tasks,
             total_count=len(tasks),
             filtered_count=len(tasks)
         )
         
     except Exception as e:
-        logger.error(f"Error listing tasks: {e}")
+        logger.error("Error listing tasks: {}", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/health")
-async def health_check():
-    """Detailed health check for monitoring"""
+async def health_check(request: Request, response: Response):
+    """Detailed health check for monitoring
+    
+    Sets an ETag so probes sending If-None-Match get an empty 304 while the
+    status, queue-size bucket and uptime bucket are unchanged.
+    """
     try:
         from tlt.services.tlt_service.main import agent_manager
         
         health_status = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _iso_now(),
             "service": "tlt_service",
             "status": "healthy"
         }
@@ -138,12 +182,21 @@ async def health_check():
         elif health_status["status"] == "warning":
             status_code = 200  # Still healthy, just warning
         
+        etag = _health_etag(
+            health_status["status"],
+            health_status.get("queue_size", 0),
+            health_status.get("uptime_seconds")
+        )
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        
+        response.headers["ETag"] = etag
         return health_status
         
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: {}", e)
         return {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _iso_now(),
             "service": "tlt_service",
             "status": "unhealthy",
             "error": str(e)
@@ -160,21 +213,15 @@ async def get_metrics():
         
         status = await agent_manager.get_status()
         
-        # Calculate additional metrics
-        total_tasks = status["metrics"]["tasks_completed"] + status["metrics"]["tasks_failed"]
-        success_rate = 0
-        if total_tasks > 0:
-            success_rate = status["metrics"]["tasks_completed"] / total_tasks * 100
-        
         metrics = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _iso_now(),
             "service_metrics": {
                 "uptime_seconds": status["uptime_seconds"],
                 "tasks_received": status["metrics"]["tasks_received"],
                 "tasks_completed": status["metrics"]["tasks_completed"],
                 "tasks_failed": status["metrics"]["tasks_failed"],
                 "tasks_pending": status["pending_tasks"],
-                "success_rate_percent": round(success_rate, 2),
+                "success_rate_percent": status["metrics"]["success_rate_percent"],
                 "rate_limit_hits": status["metrics"]["rate_limit_hits"],
                 "queue_size": status["queue_size"]
             },
@@ -184,7 +231,7 @@ async def get_metrics():
         return metrics
         
     except Exception as e:
-        logger.error(f"Error getting metrics: {e}")
+        logger.error("Error getting metrics: {}", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/actions/clear-completed-tasks")
@@ -205,11 +252,11 @@ async def clear_completed_tasks():
         return {
             "message": f"Cleared {cleared_count} completed tasks",
             "cleared_count": cleared_count,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _iso_now()
         }
         
     except Exception as e:
-        logger.error(f"Error clearing completed tasks: {e}")
+        logger.error("Error clearing completed tasks: {}", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/debug/agent-state")
@@ -222,24 +269,75 @@ async def get_agent_state():
             raise HTTPException(status_code=503, detail="Agent manager not initialized")
         
         # Return agent manager state instead of agent state
+        state = await agent_manager.snapshot_debug_state()
         return {
-            "agent_manager_state": {
-                "agent_id": getattr(agent_manager, 'agent_id', None),
-                "debug_mode": agent_manager.debug_mode,
-                "running": agent_manager.running,
-                "pending_tasks_count": len(agent_manager.pending_tasks),
-                "completed_tasks_count": len(agent_manager.completed_tasks),
-                "mode": "event_driven"
-            },
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "agent_manager_state": state,
+            "timestamp": _iso_now()
         }
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting agent state: {e}")
+        logger.error("Error getting agent state: {}", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+def _build_agent_state_response(agent_manager) -> Dict[str, Any]:
+    """Build the per-guild agent state payload consumed by the Discord adapter"""
+    # Get the actual agent state if available
+    agent_state = None
+    if agent_manager.agent and hasattr(agent_manager.agent, 'current_state'):
+        agent_state = agent_manager.agent.current_state
+    
+    if not agent_state:
+        return {
+            "timestamp": _iso_now(),
+            "agent_running": agent_manager.running,
+            **_EMPTY_AGENT_STATE_TMPL
+        }
+    
+    # Prepare response with guild-specific state
+    response = {
+        "timestamp": _iso_now(),
+        "agent_running": agent_manager.running,
+        "agent_state_available": True,
+        "agent_state_by_guild": {}
+    }
+    
+    # Extract guild-specific information
+    registered_guilds = agent_state.get("registered_guilds", {})
+    rsvp_predictions = agent_state.get("rsvp_predictions", {})
+    
+    # Bucket RSVP predictions ("<guild_id>_<event_id>") and pending messages by guild once.
+    # Both ids may contain "_" (the "dm_channel" guild id, "guild_registration" event id),
+    # so a key goes to the longest registered guild id it starts with.
+    predictions_by_guild = {}
+    for prediction_key, prediction_data in rsvp_predictions.items():
+        split_at = prediction_key.rfind("_")
+        while split_at > 0 and prediction_key[:split_at] not in registered_guilds:
+            split_at = prediction_key.rfind("_", 0, split_at)
+        if split_at > 0:
+            predictions_by_guild.setdefault(prediction_key[:split_at], {})[prediction_key] = prediction_data
+    
+    messages_by_guild = {}
+    for message in agent_state.get("pending_messages", []):
+        # MessageToSend always carries channel_id, content and a defaulted priority
+        messages_by_guild.setdefault(message.guild_id, []).append({
+            "channel_id": message.channel_id,
+            "content": message.content,
+            "priority": message.priority.value
+        })
+    
+    # Group state by guild
+    for guild_id, guild_info in registered_guilds.items():
+        guild_state = _GUILD_STATE_TMPL.copy()
+        guild_state["guild_info"] = guild_info
+        guild_state["rsvp_predictions"] = predictions_by_guild.get(guild_id, {})
+        guild_state["pending_messages"] = messages_by_guild.get(guild_id, [])
+        
+        response["agent_state_by_guild"][guild_id] = guild_state
+    
+    return response
+
 @router.get("/agent/state")
 async def get_agent_state_for_discord():
     """Get agent state for Discord adapter periodic queries"""
@@ -249,55 +347,24 @@ async def get_agent_state_for_discord():
         if not agent_manager:
             raise HTTPException(status_code=503, detail="Agent manager not initialized")
         
-        # Get the actual agent state if available
-        agent_state = None
-        if agent_manager.agent and hasattr(agent_manager.agent, 'current_state'):
-            agent_state = agent_manager.agent.current_state
+        agent = agent_manager.agent
+        if agent is None:
+            return _build_agent_state_response(agent_manager)
         
-        # Prepare response with guild-specific state
-        response = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "agent_running": agent_manager.running,
-            "agent_state_available": agent_state is not None,
-            "agent_state_by_guild": {}
-        }
+        # Serve the previously encoded body while the agent state is unchanged;
+        # its timestamp is the time that body was built
+        cache_key = (agent, agent.state_version, agent_manager.running)
+        cached = agent_manager.agent_state_body_cache
+        if cached is None or cached[0] != cache_key:
+            payload = jsonable_encoder(_build_agent_state_response(agent_manager))
+            # Same compact encoding JSONResponse renders
+            body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            cached = agent_manager.agent_state_body_cache = (cache_key, body)
         
-        if agent_state:
-            # Extract guild-specific information
-            registered_guilds = agent_state.get("registered_guilds", {})
-            rsvp_predictions = agent_state.get("rsvp_predictions", {})
-            
-            # Group state by guild
-            for guild_id, guild_info in registered_guilds.items():
-                guild_state = {
-                    "guild_info": guild_info,
-                    "pending_messages": [],
-                    "event_updates": [],
-                    "user_notifications": [],
-                    "rsvp_predictions": {}
-                }
-                
-                # Add RSVP predictions for this guild
-                for prediction_key, prediction_data in rsvp_predictions.items():
-                    if prediction_key.startswith(f"{guild_id}_"):
-                        guild_state["rsvp_predictions"][prediction_key] = prediction_data
-                
-                # Add any pending messages for this guild
-                pending_messages = agent_state.get("pending_messages", [])
-                for message in pending_messages:
-                    if message.get("guild_id") == guild_id:
-                        guild_state["pending_messages"].append({
-                            "channel_id": message.get("channel_id"),
-                            "content": message.get("content"),
-                            "priority": message.get("priority", "normal")
-                        })
-                
-                response["agent_state_by_guild"][guild_id] = guild_state
-        
-        return response
+        return Response(content=cached[1], media_type="application/json")
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting agent state for Discord: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        logger.error("Error getting agent state for Discord: {}", e)
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,9 +1,12 @@
 """CloudEvents CNCF standard models for TLT"""
 
-import uuid
+import os
+import sys
+from functools import lru_cache
+from time import time as _epoch_seconds
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, Union
-from pydantic import BaseModel, Field, validator, field_serializer
+from typing import Callable, Dict, Any, List, Literal, Optional, Tuple, Type
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 from enum import Enum
 
 
@@ -32,20 +35,54 @@ class TLTEventType(str, Enum):
     EVENT_INFO = "com.tlt.discord.event-info"
 
 
+# Interned type strings for the factories, so they skip Enum.value lookups
+_TYPE_STR: Dict[TLTEventType, str] = {
+    event_type: sys.intern(event_type.value) for event_type in TLTEventType
+}
+# Literal over every TLT event type; pydantic-core checks it without a Python validator
+_EventTypeStr = Literal[tuple(_TYPE_STR.values())]
+
+
+def _new_id() -> str:
+    """Generate a CloudEvent id (32-char hex UUID4, skips dashed formatting)"""
+    import uuid  # Deferred so importing TLTEventType alone stays cheap
+    return uuid.uuid4().hex
+
+
+# (epoch second, UTC datetime) for the most recent default event time;
+# swapped as one tuple so concurrent readers never see a mixed entry
+_EPOCH = datetime.fromtimestamp(0, tz=timezone.utc)
+_now_cache = (0, _EPOCH)
+
+
+def _cached_now() -> datetime:
+    """Current UTC time at second resolution, reused for every event in that second"""
+    global _now_cache
+    second = int(_epoch_seconds())
+    cached = _now_cache
+    if cached[0] != second:
+        now = datetime.fromtimestamp(second, tz=timezone.utc)
+        cached = _now_cache = (second, now)
+    return cached[1]
+
+
 class CloudEvent(BaseModel):
     """
     CloudEvents v1.0 specification implementation
     https://github.com/cloudevents/spec/blob/v1.0/spec.md
+    
+    Validators only run for inbound events; the create_*_cloudevent factories
+    below use model_construct() since every field they set is produced here.
     """
     
     # Required attributes
     specversion: str = Field("1.0", description="CloudEvents specification version")
-    type: str = Field(..., description="Event type in reverse DNS notation")
+    type: _EventTypeStr = Field(..., description="Event type in reverse DNS notation")
     source: str = Field(..., description="Event source URI")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Event identifier")
+    id: str = Field(default_factory=_new_id, description="Event identifier")
     
     # Optional attributes
-    time: Optional[datetime] = Field(default_factory=lambda: datetime.now(timezone.utc), description="Event timestamp")
+    time: Optional[datetime] = Field(default_factory=_cached_now, description="Event timestamp")
     datacontenttype: Optional[str] = Field("application/json", description="Content type of data")
     dataschema: Optional[str] = Field(None, description="URI of the schema for data")
     subject: Optional[str] = Field(None, description="Subject of the event")
@@ -53,32 +90,40 @@ class CloudEvent(BaseModel):
     # Event data
     data: Optional[Dict[str, Any]] = Field(None, description="Event payload")
     
-    @validator('time', pre=True)
-    def validate_time(cls, v):
-        if isinstance(v, str):
-            return datetime.fromisoformat(v.replace('Z', '+00:00'))
-        return v
+    def to_json_bytes(self) -> bytes:
+        """Serialize straight to JSON bytes via pydantic-core, skipping the dict pass
+        
+        Unset optional attributes (None) are left out, as the CloudEvents spec allows.
+        """
+        return self.__pydantic_serializer__.to_json(self, exclude_none=True)
     
-    @validator('type')
-    def validate_type(cls, v):
-        if not v.startswith('com.tlt.discord.'):
-            raise ValueError("Event type must start with 'com.tlt.discord.'")
-        return v
+    def to_orjson(self) -> bytes:
+        """Serialize through orjson; same output as to_json_bytes()
+        
+        Unset optional attributes (None) are left out, as the CloudEvents spec allows.
+        """
+        import orjson  # Deferred; only pulled in by callers on the orjson path
+        return orjson.dumps(self.model_dump(mode="json", exclude_none=True))
+
+
+class TLTEventData(BaseModel):
+    """Base for TLT CloudEvent data payloads
     
-    @field_serializer('time')
-    def serialize_time(self, value: Optional[datetime]) -> Optional[str]:
-        """Serialize datetime to ISO string for JSON compatibility"""
-        return value.isoformat() if value else None
+    The create_*_cloudevent factories emit plain dicts with these fields since
+    their inputs come from the adapters; validation applies on the consumer side,
+    so schema building is deferred until a model is first used.
+    """
+    model_config = ConfigDict(extra='forbid', frozen=True, defer_build=True)
 
 
-class TLTCreateEventData(BaseModel):
+class TLTCreateEventData(TLTEventData):
     """Data payload for com.tlt.discord.create-event"""
     event_data: Dict[str, Any] = Field(..., description="Event creation data")
     interaction_data: Dict[str, Any] = Field(..., description="Discord interaction context")
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
 
 
-class TLTUpdateEventData(BaseModel):
+class TLTUpdateEventData(TLTEventData):
     """Data payload for com.tlt.discord.update-event"""
     event_id: str = Field(..., description="ID of event being updated")
     update_type: str = Field(..., description="Type of update")
@@ -87,7 +132,7 @@ class TLTUpdateEventData(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
 
 
-class TLTRSVPEventData(BaseModel):
+class TLTRSVPEventData(TLTEventData):
     """Data payload for com.tlt.discord.rsvp-event"""
     guild_id: str = Field(..., description="Discord guild ID")
     event_id: str = Field(..., description="ID of event for RSVP")
@@ -97,7 +142,7 @@ class TLTRSVPEventData(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
 
 
-class TLTDiscordMessageData(BaseModel):
+class TLTDiscordMessageData(TLTEventData):
     """Data payload for com.tlt.discord.message"""
     guild_id: str = Field(..., description="Discord guild ID")
     channel_id: str = Field(..., description="Discord channel ID") 
@@ -108,7 +153,7 @@ class TLTDiscordMessageData(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
 
 
-class TLTPhotoVibeCheckData(BaseModel):
+class TLTPhotoVibeCheckData(TLTEventData):
     """Data payload for com.tlt.discord.photo-vibe-check"""
     guild_id: str = Field(..., description="Discord guild ID or 'dm_channel' for DMs")
     channel_id: str = Field(..., description="Discord channel ID")
@@ -123,7 +168,7 @@ class TLTPhotoVibeCheckData(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
 
 
-class TLTVibeActionData(BaseModel):
+class TLTVibeActionData(TLTEventData):
     """Data payload for com.tlt.discord.vibe-action"""
     guild_id: str = Field(..., description="Discord guild ID")
     channel_id: str = Field(..., description="Discord channel ID")
@@ -135,7 +180,7 @@ class TLTVibeActionData(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
 
 
-class TLTPromotionImageData(BaseModel):
+class TLTPromotionImageData(TLTEventData):
     """Data payload for com.tlt.discord.promotion-image"""
     guild_id: str = Field(..., description="Discord guild ID")
     channel_id: str = Field(..., description="Discord channel ID")
@@ -151,7 +196,7 @@ class TLTPromotionImageData(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
 
 
-class TLTSaveEventToGuildDataData(BaseModel):
+class TLTSaveEventToGuildDataData(TLTEventData):
     """Data payload for com.tlt.discord.save-event-to-guild-data"""
     event_id: str = Field(..., description="Event ID (message ID)")
     guild_id: str = Field(..., description="Discord guild ID")
@@ -161,7 +206,7 @@ class TLTSaveEventToGuildDataData(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
 
 
-class TLTTimerTriggerData(BaseModel):
+class TLTTimerTriggerData(TLTEventData):
     """Data payload for com.tlt.discord.timer-trigger"""
     event_id: str = Field(..., description="Event ID for timer")
     timer_type: str = Field(..., description="Type of timer")
@@ -174,60 +219,177 @@ class TLTTimerTriggerData(BaseModel):
         return value.isoformat()
 
 
-class TLTRegisterGuildData(BaseModel):
-    """Data payload for com.tlt.discord.register-guild"""
+class _GuildCommandData(TLTEventData):
+    """Fields shared by the guild-scoped slash command payloads"""
     guild_id: str = Field(..., description="Discord guild ID")
-    guild_name: str = Field(..., description="Discord guild name")
-    user_id: str = Field(..., description="User registering the guild")
-    user_name: str = Field(..., description="Username of registering user")
     channel_id: str = Field(..., description="Channel where command was executed")
-    channel_name: str = Field(..., description="Channel name")
+    user_id: str = Field(..., description="User executing the command")
+    user_name: str = Field(..., description="Username of executing user")
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
 
 
-class TLTDeregisterGuildData(BaseModel):
-    """Data payload for com.tlt.discord.deregister-guild"""
-    guild_id: str = Field(..., description="Discord guild ID")
+class _GuildLifecycleData(_GuildCommandData):
+    """Data payload for com.tlt.discord.register-guild and com.tlt.discord.deregister-guild
+    
+    Both carry the same fields; consumers tell them apart by CloudEvent.type.
+    """
     guild_name: str = Field(..., description="Discord guild name")
-    user_id: str = Field(..., description="User deregistering the guild")
-    user_name: str = Field(..., description="Username of deregistering user")
-    channel_id: str = Field(..., description="Channel where command was executed")
     channel_name: str = Field(..., description="Channel name")
-    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
 
 
-class TLTListEventsData(BaseModel):
+TLTRegisterGuildData = TLTDeregisterGuildData = _GuildLifecycleData
+
+
+class TLTListEventsData(_GuildCommandData):
     """Data payload for com.tlt.discord.list-events"""
-    guild_id: str = Field(..., description="Discord guild ID")
-    channel_id: str = Field(..., description="Channel where list was requested")
-    user_id: str = Field(..., description="User requesting the list")
-    user_name: str = Field(..., description="Username of requesting user")
-    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
 
 
-class TLTEventInfoData(BaseModel):
+class TLTEventInfoData(_GuildCommandData):
     """Data payload for com.tlt.discord.event-info"""
-    guild_id: str = Field(..., description="Discord guild ID")
-    channel_id: str = Field(..., description="Channel where info was requested")
-    user_id: str = Field(..., description="User requesting info")
-    user_name: str = Field(..., description="Username of requesting user")
     event_id: str = Field(..., description="ID of event to get info for")
-    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
 
 
-class TLTDeleteEventData(BaseModel):
+class TLTDeleteEventData(_GuildCommandData):
     """Data payload for com.tlt.discord.delete-event"""
-    guild_id: str = Field(..., description="Discord guild ID")
-    channel_id: str = Field(..., description="Channel where event was deleted")
-    user_id: str = Field(..., description="User deleting the event")
-    user_name: str = Field(..., description="Username of deleting user")
     event_id: str = Field(..., description="ID of event to delete")
-    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
 
 
+@lru_cache(maxsize=2048)
+def _base(type_str: str, source: str) -> Dict[str, Any]:
+    """CloudEvent attributes shared by every event of one type from one source
+    
+    The cached dict is only ever unpacked into model_construct(), never mutated.
+    """
+    return {
+        "specversion": "1.0",
+        "type": type_str,
+        "source": source,
+        "datacontenttype": "application/json",
+        "dataschema": None,
+    }
+
+
+def _make_factory(event_type: TLTEventType):
+    """Build an unvalidated CloudEvent constructor with its event type pre-bound"""
+    type_str = _TYPE_STR[event_type]
+    construct = CloudEvent.model_construct
+    
+    def build(source: str, data: Dict[str, Any], subject: Optional[str], id: Optional[str]) -> CloudEvent:
+        return construct(**_base(type_str, source), id=id or _new_id(), data=data, subject=subject)
+    
+    return build
+
+
+_CLOUDEVENT_BUILDERS = {event_type: _make_factory(event_type) for event_type in TLTEventType}
+
+
+@lru_cache(maxsize=4096)
 def create_discord_source(guild_id: str, channel_id: str) -> str:
-    """Create a Discord source URI following CloudEvents format"""
-    return f"/discord/{guild_id}/{channel_id}"
+    """Create a Discord source URI following CloudEvents format
+    
+    Cached since a bot only serves a bounded set of guild/channel pairs.
+    """
+    return sys.intern("/discord/" + guild_id + "/" + channel_id)
+
+
+@lru_cache(maxsize=2048)
+def _subject(*parts: Any) -> str:
+    """Join subject parts with '-'; cached as RSVP/vibe loops repeat the same ids"""
+    return "-".join(map(str, parts))
+
+
+# event type -> (data model, default subject built from the emitted fields)
+_FACTORY_TABLE: Dict[TLTEventType, Tuple[Type[TLTEventData], Callable[[Dict[str, Any]], str]]] = {
+    TLTEventType.CREATE_EVENT: (
+        TLTCreateEventData, lambda f: _subject("event-creation", f["interaction_data"].get('user_id', 'unknown'))),
+    TLTEventType.DISCORD_MESSAGE: (TLTDiscordMessageData, lambda f: _subject("message", f["user_id"])),
+    TLTEventType.UPDATE_EVENT: (TLTUpdateEventData, lambda f: _subject("event", f["event_id"], "update")),
+    TLTEventType.TIMER_TRIGGER: (TLTTimerTriggerData, lambda f: _subject("timer", f["event_id"], f["timer_type"])),
+    TLTEventType.REGISTER_GUILD: (TLTRegisterGuildData, lambda f: _subject("register-guild", f["guild_id"])),
+    TLTEventType.DEREGISTER_GUILD: (TLTDeregisterGuildData, lambda f: _subject("deregister-guild", f["guild_id"])),
+    TLTEventType.LIST_EVENTS: (TLTListEventsData, lambda f: _subject("list-events", f["user_id"])),
+    TLTEventType.EVENT_INFO: (TLTEventInfoData, lambda f: _subject("event-info", f["event_id"])),
+    TLTEventType.DELETE_EVENT: (TLTDeleteEventData, lambda f: _subject("delete-event", f["event_id"])),
+    TLTEventType.RSVP_EVENT: (
+        TLTRSVPEventData, lambda f: _subject("rsvp", f["event_id"], f["user_id"], f["action"])),
+    TLTEventType.PHOTO_VIBE_CHECK: (
+        TLTPhotoVibeCheckData, lambda f: _subject("photo-vibe-check", f["user_id"], f["filename"])),
+    TLTEventType.VIBE_ACTION: (
+        TLTVibeActionData, lambda f: _subject("vibe-action", f["user_id"], f["action"], f["event_id"])),
+    TLTEventType.PROMOTION_IMAGE: (
+        TLTPromotionImageData, lambda f: _subject("promotion-image", f["user_id"], f["event_id"], f["filename"])),
+    TLTEventType.SAVE_EVENT_TO_GUILD_DATA: (
+        TLTSaveEventToGuildDataData, lambda f: _subject("save-event", f["guild_id"], f["event_id"])),
+}
+
+# (data field name, required by the consumer model) per event type, in model order
+_DATA_FIELDS: Dict[TLTEventType, Tuple[Tuple[str, bool], ...]] = {
+    event_type: tuple((name, field.is_required()) for name, field in model.model_fields.items())
+    for event_type, (model, _) in _FACTORY_TABLE.items()
+}
+
+
+def emit(
+    event_type: TLTEventType,
+    guild_id: str,
+    channel_id: str,
+    subject: Optional[str] = None,
+    cloud_event_id: Optional[str] = None,
+    **fields: Any
+) -> CloudEvent:
+    """Create a TLT CloudEvent of any type from its data fields
+    
+    guild_id/channel_id form the source and fill the matching data fields;
+    the subject defaults to the one _FACTORY_TABLE builds for the event type.
+    """
+    default_subject = _FACTORY_TABLE[event_type][1]
+    fields["guild_id"] = guild_id
+    fields["channel_id"] = channel_id
+    
+    data = {}
+    for name, required in _DATA_FIELDS[event_type]:
+        value = fields.get(name)
+        # Optional fields left as None/{} stay off the wire; consumer models default them
+        if not required and (value is None or value == {}):
+            continue
+        data[name] = value
+    
+    return _CLOUDEVENT_BUILDERS[event_type](
+        source=create_discord_source(guild_id, channel_id),
+        data=data,
+        subject=subject or default_subject(fields),
+        id=cloud_event_id
+    )
+
+
+def create_cloudevents_bulk(
+    event_type: TLTEventType,
+    source: str,
+    payloads: List[Dict[str, Any]],
+    subjects: List[Optional[str]]
+) -> List[CloudEvent]:
+    """Create a burst of same-type CloudEvents from one source
+    
+    The batch shares its base attributes and event time, and draws all of
+    its UUID4 ids from a single os.urandom() read.
+    """
+    import uuid
+    
+    raw = os.urandom(16 * len(payloads))
+    now = datetime.now(timezone.utc)
+    base = _base(_TYPE_STR[event_type], source)
+    construct = CloudEvent.model_construct
+    
+    return [
+        construct(
+            **base,
+            id=uuid.UUID(bytes=raw[offset:offset + 16], version=4).hex,
+            time=now,
+            data=payload,
+            subject=subject
+        )
+        for offset, payload, subject in zip(range(0, len(raw), 16), payloads, subjects, strict=True)
+    ]
 
 
 def create_create_event_cloudevent(
@@ -241,23 +403,11 @@ def create_create_event_cloudevent(
 ) -> CloudEvent:
     """Create a CloudEvent for event creation from Discord"""
     
-    data = TLTCreateEventData(
-        event_data=event_data,
-        interaction_data=interaction_data,
-        metadata=metadata or {}
+    return emit(
+        TLTEventType.CREATE_EVENT, guild_id, channel_id,
+        subject=subject, cloud_event_id=event_id,
+        event_data=event_data, interaction_data=interaction_data, metadata=metadata
     )
-    
-    cloud_event = CloudEvent(
-        type=TLTEventType.CREATE_EVENT,
-        source=create_discord_source(guild_id, channel_id),
-        data=data.model_dump(),
-        subject=subject or f"event-creation-{interaction_data.get('user_id', 'unknown')}"
-    )
-    
-    if event_id:
-        cloud_event.id = event_id
-    
-    return cloud_event
 
 
 def create_discord_message_cloudevent(
@@ -272,27 +422,11 @@ def create_discord_message_cloudevent(
 ) -> CloudEvent:
     """Create a CloudEvent for Discord message"""
     
-    data = TLTDiscordMessageData(
-        guild_id=guild_id,
-        channel_id=channel_id,
-        user_id=user_id,
-        message_id=message_id,
-        content=content,
-        message_type=message_type,
-        metadata=metadata or {}
-    )
-    
-    cloud_event = CloudEvent(
-        type=TLTEventType.DISCORD_MESSAGE,
-        source=create_discord_source(guild_id, channel_id),
-        data=data.model_dump(),
-        subject=f"message-{user_id}"
+    return emit(
+        TLTEventType.DISCORD_MESSAGE, guild_id, channel_id, cloud_event_id=event_id,
+        user_id=user_id, message_id=message_id, content=content,
+        message_type=message_type, metadata=metadata
     )
-    
-    if event_id:
-        cloud_event.id = event_id
-    
-    return cloud_event
 
 
 def create_update_event_cloudevent(
@@ -307,25 +441,11 @@ def create_update_event_cloudevent(
 ) -> CloudEvent:
     """Create a CloudEvent for event update"""
     
-    data = TLTUpdateEventData(
-        event_id=event_id,
-        update_type=update_type,
-        update_data=update_data,
-        user_id=user_id,
-        metadata=metadata or {}
-    )
-    
-    cloud_event = CloudEvent(
-        type=TLTEventType.UPDATE_EVENT,
-        source=create_discord_source(guild_id, channel_id),
-        data=data.model_dump(),
-        subject=f"event-{event_id}-update"
+    return emit(
+        TLTEventType.UPDATE_EVENT, guild_id, channel_id, cloud_event_id=cloud_event_id,
+        event_id=event_id, update_type=update_type, update_data=update_data,
+        user_id=user_id, metadata=metadata
     )
-    
-    if cloud_event_id:
-        cloud_event.id = cloud_event_id
-    
-    return cloud_event
 
 
 def create_timer_trigger_cloudevent(
@@ -339,24 +459,11 @@ def create_timer_trigger_cloudevent(
 ) -> CloudEvent:
     """Create a CloudEvent for timer trigger"""
     
-    data = TLTTimerTriggerData(
-        event_id=event_id,
-        timer_type=timer_type,
-        scheduled_time=scheduled_time,
-        metadata=metadata or {}
-    )
-    
-    cloud_event = CloudEvent(
-        type=TLTEventType.TIMER_TRIGGER,
-        source=create_discord_source(guild_id, channel_id),
-        data=data.model_dump(),
-        subject=f"timer-{event_id}-{timer_type}"
+    return emit(
+        TLTEventType.TIMER_TRIGGER, guild_id, channel_id, cloud_event_id=cloud_event_id,
+        event_id=event_id, timer_type=timer_type,
+        scheduled_time=scheduled_time.isoformat(), metadata=metadata
     )
-    
-    if cloud_event_id:
-        cloud_event.id = cloud_event_id
-    
-    return cloud_event
 
 
 def create_register_guild_cloudevent(
@@ -371,27 +478,11 @@ def create_register_guild_cloudevent(
 ) -> CloudEvent:
     """Create a CloudEvent for guild registration"""
     
-    data = TLTRegisterGuildData(
-        guild_id=guild_id,
-        guild_name=guild_name,
-        user_id=user_id,
-        user_name=user_name,
-        channel_id=channel_id,
-        channel_name=channel_name,
-        metadata=metadata or {}
+    return emit(
+        TLTEventType.REGISTER_GUILD, guild_id, channel_id, cloud_event_id=cloud_event_id,
+        guild_name=guild_name, user_id=user_id, user_name=user_name,
+        channel_name=channel_name, metadata=metadata
     )
-    
-    cloud_event = CloudEvent(
-        type=TLTEventType.REGISTER_GUILD,
-        source=create_discord_source(guild_id, channel_id),
-        data=data.model_dump(),
-        subject=f"register-guild-{guild_id}"
-    )
-    
-    if cloud_event_id:
-        cloud_event.id = cloud_event_id
-    
-    return cloud_event
 
 
 def create_deregister_guild_cloudevent(
@@ -406,27 +497,11 @@ def create_deregister_guild_cloudevent(
 ) -> CloudEvent:
     """Create a CloudEvent for guild deregistration"""
     
-    data = TLTDeregisterGuildData(
-        guild_id=guild_id,
-        guild_name=guild_name,
-        user_id=user_id,
-        user_name=user_name,
-        channel_id=channel_id,
-        channel_name=channel_name,
-        metadata=metadata or {}
-    )
-    
-    cloud_event = CloudEvent(
-        type=TLTEventType.DEREGISTER_GUILD,
-        source=create_discord_source(guild_id, channel_id),
-        data=data.model_dump(),
-        subject=f"deregister-guild-{guild_id}"
+    return emit(
+        TLTEventType.DEREGISTER_GUILD, guild_id, channel_id, cloud_event_id=cloud_event_id,
+        guild_name=guild_name, user_id=user_id, user_name=user_name,
+        channel_name=channel_name, metadata=metadata
     )
-    
-    if cloud_event_id:
-        cloud_event.id = cloud_event_id
-    
-    return cloud_event
 
 
 def create_list_events_cloudevent(
@@ -439,25 +514,10 @@ def create_list_events_cloudevent(
 ) -> CloudEvent:
     """Create a CloudEvent for listing events"""
     
-    data = TLTListEventsData(
-        guild_id=guild_id,
-        channel_id=channel_id,
-        user_id=user_id,
-        user_name=user_name,
-        metadata=metadata or {}
+    return emit(
+        TLTEventType.LIST_EVENTS, guild_id, channel_id, cloud_event_id=cloud_event_id,
+        user_id=user_id, user_name=user_name, metadata=metadata
     )
-    
-    cloud_event = CloudEvent(
-        type=TLTEventType.LIST_EVENTS,
-        source=create_discord_source(guild_id, channel_id),
-        data=data.model_dump(),
-        subject=f"list-events-{user_id}"
-    )
-    
-    if cloud_event_id:
-        cloud_event.id = cloud_event_id
-    
-    return cloud_event
 
 
 def create_event_info_cloudevent(
@@ -471,26 +531,10 @@ def create_event_info_cloudevent(
 ) -> CloudEvent:
     """Create a CloudEvent for event info request"""
     
-    data = TLTEventInfoData(
-        guild_id=guild_id,
-        channel_id=channel_id,
-        user_id=user_id,
-        user_name=user_name,
-        event_id=event_id,
-        metadata=metadata or {}
+    return emit(
+        TLTEventType.EVENT_INFO, guild_id, channel_id, cloud_event_id=cloud_event_id,
+        user_id=user_id, user_name=user_name, event_id=event_id, metadata=metadata
     )
-    
-    cloud_event = CloudEvent(
-        type=TLTEventType.EVENT_INFO,
-        source=create_discord_source(guild_id, channel_id),
-        data=data.model_dump(),
-        subject=f"event-info-{event_id}"
-    )
-    
-    if cloud_event_id:
-        cloud_event.id = cloud_event_id
-    
-    return cloud_event
 
 
 def create_delete_event_cloudevent(
@@ -504,26 +548,10 @@ def create_delete_event_cloudevent(
 ) -> CloudEvent:
     """Create a CloudEvent for event deletion"""
     
-    data = TLTDeleteEventData(
-        guild_id=guild_id,
-        channel_id=channel_id,
-        user_id=user_id,
-        user_name=user_name,
-        event_id=event_id,
-        metadata=metadata or {}
-    )
-    
-    cloud_event = CloudEvent(
-        type=TLTEventType.DELETE_EVENT,
-        source=create_discord_source(guild_id, channel_id),
-        data=data.model_dump(),
-        subject=f"delete-event-{event_id}"
+    return emit(
+        TLTEventType.DELETE_EVENT, guild_id, channel_id, cloud_event_id=cloud_event_id,
+        user_id=user_id, user_name=user_name, event_id=event_id, metadata=metadata
     )
-    
-    if cloud_event_id:
-        cloud_event.id = cloud_event_id
-    
-    return cloud_event
 
 
 def create_rsvp_event_cloudevent(
@@ -540,26 +568,11 @@ def create_rsvp_event_cloudevent(
 ) -> CloudEvent:
     """Create a CloudEvent for RSVP reaction"""
     
-    data = TLTRSVPEventData(
-        guild_id=guild_id,
-        event_id=event_id,
-        user_id=user_id,
-        rsvp_type=rsvp_type,
-        emoji=emoji,
-        metadata=metadata or {}
+    return emit(
+        TLTEventType.RSVP_EVENT, guild_id, channel_id, cloud_event_id=cloud_event_id,
+        event_id=event_id, user_id=user_id, rsvp_type=rsvp_type, emoji=emoji,
+        action=action, metadata=metadata
     )
-    
-    cloud_event = CloudEvent(
-        type=TLTEventType.RSVP_EVENT,
-        source=create_discord_source(guild_id, channel_id),
-        data=data.model_dump(),
-        subject=f"rsvp-{event_id}-{user_id}-{action}"
-    )
-    
-    if cloud_event_id:
-        cloud_event.id = cloud_event_id
-    
-    return cloud_event
 
 
 def create_photo_vibe_check_cloudevent(
@@ -578,31 +591,12 @@ def create_photo_vibe_check_cloudevent(
 ) -> CloudEvent:
     """Create a CloudEvent for photo vibe check submission"""
     
-    data = TLTPhotoVibeCheckData(
-        guild_id=guild_id,
-        channel_id=channel_id,
-        user_id=user_id,
-        user_name=user_name,
-        event_id=event_id,
-        photo_url=photo_url,
-        filename=filename,
-        content_type=content_type,
-        size=size,
-        message_content=message_content,
-        metadata=metadata or {}
+    return emit(
+        TLTEventType.PHOTO_VIBE_CHECK, guild_id, channel_id, cloud_event_id=cloud_event_id,
+        user_id=user_id, user_name=user_name, event_id=event_id,
+        photo_url=photo_url, filename=filename, content_type=content_type,
+        size=size, message_content=message_content, metadata=metadata
     )
-    
-    cloud_event = CloudEvent(
-        type=TLTEventType.PHOTO_VIBE_CHECK,
-        source=create_discord_source(guild_id, channel_id),
-        data=data.model_dump(),
-        subject=f"photo-vibe-check-{user_id}-{filename}"
-    )
-    
-    if cloud_event_id:
-        cloud_event.id = cloud_event_id
-    
-    return cloud_event
 
 
 def create_vibe_action_cloudevent(
@@ -618,28 +612,11 @@ def create_vibe_action_cloudevent(
 ) -> CloudEvent:
     """Create a CloudEvent for vibe action submission"""
     
-    data = TLTVibeActionData(
-        guild_id=guild_id,
-        channel_id=channel_id,
-        user_id=user_id,
-        user_name=user_name,
-        event_id=event_id,
-        action=action,
-        event_data=event_data or {},
-        metadata=metadata or {}
-    )
-    
-    cloud_event = CloudEvent(
-        type=TLTEventType.VIBE_ACTION,
-        source=create_discord_source(guild_id, channel_id),
-        data=data.model_dump(),
-        subject=f"vibe-action-{user_id}-{action}-{event_id}"
+    return emit(
+        TLTEventType.VIBE_ACTION, guild_id, channel_id, cloud_event_id=cloud_event_id,
+        user_id=user_id, user_name=user_name, event_id=event_id, action=action,
+        event_data=event_data, metadata=metadata
     )
-    
-    if cloud_event_id:
-        cloud_event.id = cloud_event_id
-    
-    return cloud_event
 
 
 def create_promotion_image_cloudevent(
@@ -659,32 +636,12 @@ def create_promotion_image_cloudevent(
 ) -> CloudEvent:
     """Create a CloudEvent for promotion image upload"""
     
-    data = TLTPromotionImageData(
-        guild_id=guild_id,
-        channel_id=channel_id,
-        user_id=user_id,
-        user_name=user_name,
-        event_id=event_id,
-        image_url=image_url,
-        local_path=local_path,
-        filename=filename,
-        content_type=content_type,
-        size=size,
-        event_data=event_data or {},
-        metadata=metadata or {}
+    return emit(
+        TLTEventType.PROMOTION_IMAGE, guild_id, channel_id, cloud_event_id=cloud_event_id,
+        user_id=user_id, user_name=user_name, event_id=event_id,
+        image_url=image_url, local_path=local_path, filename=filename,
+        content_type=content_type, size=size, event_data=event_data, metadata=metadata
     )
-    
-    cloud_event = CloudEvent(
-        type=TLTEventType.PROMOTION_IMAGE,
-        source=create_discord_source(guild_id, channel_id),
-        data=data.model_dump(),
-        subject=f"promotion-image-{user_id}-{event_id}-{filename}"
-    )
-    
-    if cloud_event_id:
-        cloud_event.id = cloud_event_id
-    
-    return cloud_event
 
 
 def create_save_event_to_guild_data_cloudevent(
@@ -698,23 +655,9 @@ def create_save_event_to_guild_data_cloudevent(
 ) -> CloudEvent:
     """Create a CloudEvent for saving event data to guild_data directory"""
     
-    data = TLTSaveEventToGuildDataData(
-        event_id=event_id,
-        guild_id=guild_id,
-        event_data=event_data,
-        user_id=user_id,
-        user_name=user_name,
-        metadata=metadata or {}
+    # Source is keyed by event rather than channel for guild_data saves
+    return emit(
+        TLTEventType.SAVE_EVENT_TO_GUILD_DATA, guild_id, event_id, cloud_event_id=cloud_event_id,
+        event_id=event_id, event_data=event_data, user_id=user_id,
+        user_name=user_name, metadata=metadata
     )
-    
-    cloud_event = CloudEvent(
-        type=TLTEventType.SAVE_EVENT_TO_GUILD_DATA,
-        source=create_discord_source(guild_id, event_id),
-        data=data.model_dump(),
-        subject=f"save-event-{guild_id}-{event_id}"
-    )
-    
-    if cloud_event_id:
-        cloud_event.id = cloud_event_id
-    
-    return cloud_event
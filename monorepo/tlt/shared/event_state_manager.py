@@ -1,31 +1,131 @@
-import json
-from pathlib import Path
-from typing import Optional, Type, TypeVar, List
+import asyncio
+from functools import lru_cache
+from typing import Any, Iterable, List, Tuple, Type
 from pydantic import BaseModel
 
-T = TypeVar("T", bound=BaseModel)
+from tlt.shared.state_store import T, _FileStateStore, _loads, _validate_entries
 
+try:
+    import zstandard
+except ImportError:  # Only needed for EventStateManager(compress=True)
+    zstandard = None
 
-class EventStateManager:
-    def __init__(self, root_dir: str):
-        self.root_dir = Path(root_dir)
 
-    def _get_event_file(self, guild_id: str, event_id: str) -> Path:
-        path = self.root_dir / guild_id / event_id
-        path.mkdir(parents=True, exist_ok=True)
-        return path / "event.json"
+@lru_cache(maxsize=256)
+def _split_path(field_path: str) -> Tuple[str, ...]:
+    # Nested field paths are mostly a handful of constants, so split each once
+    return tuple(field_path.split('.'))
 
-    def _load_event_data(self, guild_id: str, event_id: str) -> dict:
-        event_file = self._get_event_file(guild_id, event_id)
-        if not event_file.exists():
-            return {"event_id": event_id}
-        with event_file.open("r", encoding="utf-8") as f:
-            return json.load(f)
 
-    def _save_event_data(self, guild_id: str, event_id: str, data: dict):
-        event_file = self._get_event_file(guild_id, event_id)
-        with event_file.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+class EventStateManager(_FileStateStore):
+    # Number of event files whose parsed data is kept in memory
+    CACHE_SIZE = 256
+    _file_name = "event.json"
+    _id_field = "event_id"
+    # apply_updates() kind -> single-field method it dispatches to
+    _UPDATE_OPS = {
+        "set": "update_event_field",
+        "append": "append_to_array_field",
+        "nested": "update_nested_field",
+        "remove": "remove_from_array_field",
+    }
+
+    def __init__(self, root_dir: str, compress: bool = False):
+        """compress=True stores each event as zstd-compressed event.json.zst
+
+        A plain event.json is still read while no .zst exists yet, and is left in
+        place once the compressed copy is written. Code that opens event.json
+        directly won't see compressed events, so compression is opt-in.
+        """
+        if compress and zstandard is None:
+            raise ImportError("EventStateManager(compress=True) requires the zstandard package")
+        super().__init__(root_dir)
+        # Level 1 keeps compression cheaper than the disk bandwidth it saves
+        self._compressor = zstandard.ZstdCompressor(level=1) if compress else None
+        self._decompressor = zstandard.ZstdDecompressor() if compress else None
+        if compress:
+            self._file_name = "event.json.zst"
+
+    def _decode(self, raw: bytes) -> dict:
+        if self._decompressor:
+            raw = self._decompressor.decompress(raw)
+        return _loads(raw)
+
+    def _encode(self, data: dict) -> bytes:
+        payload = super()._encode(data)
+        if self._compressor:
+            payload = self._compressor.compress(payload)
+        return payload
+
+    def _load_missing(self, key: Tuple[str, str], path: str) -> dict:
+        if self._compressor:
+            # Legacy plain event.json beside a not-yet-written event.json.zst
+            try:
+                with open(path[:-len(".zst")], "rb") as f:
+                    return _loads(f.read())
+            except FileNotFoundError:
+                pass
+        return super()._load_missing(key, path)
+
+    def transaction(self, guild_id: str, event_id: str, fsync: bool = True):
+        """Batch several mutations of one event into a single read and a single write
+
+        Inside the block loads are served from memory and saves only mark the
+        event dirty; the file is written once when the outermost block exits
+        cleanly, fsync'd once when requested. If the block raises, the pending
+        changes are discarded.
+        """
+        return self._transaction((guild_id, event_id), fsync)
+
+    def apply_updates(
+        self,
+        guild_id: str,
+        event_id: str,
+        ops: Iterable[Tuple[str, str, Any]],
+        fsync: bool = False
+    ):
+        """Apply (kind, path, value) field updates with one read and one write
+
+        kind is one of "set", "append", "nested" or "remove" and maps onto the
+        matching single-field method. An unknown kind raises ValueError and
+        none of the updates are written.
+        """
+        with self.transaction(guild_id, event_id, fsync=fsync):
+            for kind, path, value in ops:
+                method = self._UPDATE_OPS.get(kind)
+                if method is None:
+                    raise ValueError(f"Unknown update kind: {kind}")
+                getattr(self, method)(guild_id, event_id, path, value)
+
+    # Async variants for coroutine callers: the same operation on a worker thread
+    # (via asyncio.to_thread), so file writes and fsyncs don't stall the event loop.
+    # Per-event locks keep them safe alongside the synchronous methods.
+
+    async def apply_updates_async(
+        self,
+        guild_id: str,
+        event_id: str,
+        ops: Iterable[Tuple[str, str, Any]],
+        fsync: bool = False
+    ):
+        await asyncio.to_thread(self.apply_updates, guild_id, event_id, list(ops), fsync)
+
+    async def append_to_array_field_async(
+        self,
+        guild_id: str,
+        event_id: str,
+        array_field_name: str,
+        item: Any
+    ):
+        await asyncio.to_thread(self.append_to_array_field, guild_id, event_id, array_field_name, item)
+
+    async def add_model_entry_async(
+        self,
+        guild_id: str,
+        event_id: str,
+        model_instance: BaseModel
+    ):
+        await asyncio.to_thread(self.add_model_entry, guild_id, event_id, model_instance)
 
     def add_model_entry(
         self,
@@ -33,22 +133,27 @@ class EventStateManager:
         event_id: str,
         model_instance: BaseModel
     ):
-        data = self._load_event_data(guild_id, event_id)
-        model_key = model_instance.__class__.__name__
-        model_list = data.setdefault(model_key, [])
-        model_list.append(model_instance.model_dump())
-        self._save_event_data(guild_id, event_id, data)
+        key = (guild_id, event_id)
+        with self._key_lock(key):
+            data = self._load(key)
+            model_key = model_instance.__class__.__name__
+            model_list = data.setdefault(model_key, [])
+            model_list.append(model_instance.model_dump(mode="json"))
+            self._save(key, data)
 
     def list_model_entries(
         self,
         guild_id: str,
         event_id: str,
-        model_class: Type[T]
+        model_class: Type[T],
+        construct: bool = False
     ) -> List[T]:
-        data = self._load_event_data(guild_id, event_id)
-        model_key = model_class.__name__
-        entries = data.get(model_key, [])
-        return [model_class(**entry) for entry in entries]
+        """List stored entries as model_class instances
+
+        construct=True skips validation (model_construct) for callers that trust the file.
+        """
+        data = self._load((guild_id, event_id))
+        return _validate_entries(model_class, data.get(model_class.__name__, []), construct)
 
     def update_model_entry(
         self,
@@ -57,27 +162,17 @@ class EventStateManager:
         model_instance: BaseModel,
         identifier_field: str
     ):
-        data = self._load_event_data(guild_id, event_id)
         model_key = model_instance.__class__.__name__
         identifier_value = getattr(model_instance, identifier_field)
+        updated_entry = model_instance.model_dump(mode="json")
 
-        entries = data.get(model_key, [])
-        updated = False
-
-        for i, entry in enumerate(entries):
-            if entry.get(identifier_field) == identifier_value:
-                entries[i] = model_instance.model_dump()
-                updated = True
-                break
-
-        if not updated:
+        if not self._update_stored_entry(
+            (guild_id, event_id), model_key, identifier_field, identifier_value, updated_entry
+        ):
             raise ValueError(
                 f"No entry with {identifier_field}={identifier_value} found in {model_key}."
             )
 
-        data[model_key] = entries
-        self._save_event_data(guild_id, event_id, data)
-
     def delete_model_entry(
         self,
         guild_id: str,
@@ -86,29 +181,19 @@ class EventStateManager:
         identifier_field: str,
         identifier_value: str
     ):
-        data = self._load_event_data(guild_id, event_id)
         model_key = model_class.__name__
-        original_list = data.get(model_key, [])
-        new_list = [
-            entry for entry in original_list
-            if entry.get(identifier_field) != identifier_value
-        ]
 
-        if len(new_list) == len(original_list):
+        if not self._delete_stored_entries((guild_id, event_id), model_key, identifier_field, identifier_value):
             raise ValueError(
                 f"No entry with {identifier_field}={identifier_value} found in {model_key}."
             )
 
-        data[model_key] = new_list
-        self._save_event_data(guild_id, event_id, data)
-
     def list_model_types(
         self,
         guild_id: str,
         event_id: str
     ) -> List[str]:
-        data = self._load_event_data(guild_id, event_id)
-        return [k for k in data.keys() if k != "event_id"]
+        return self._stored_model_types((guild_id, event_id))
 
     def update_event_field(
         self,
@@ -118,9 +203,11 @@ class EventStateManager:
         field_value: any
     ):
         """Update a single field in the event data"""
-        data = self._load_event_data(guild_id, event_id)
-        data[field_name] = field_value
-        self._save_event_data(guild_id, event_id, data)
+        key = (guild_id, event_id)
+        with self._key_lock(key):
+            data = self._load(key)
+            data[field_name] = field_value
+            self._save(key, data)
 
     def append_to_array_field(
         self,
@@ -130,13 +217,14 @@ class EventStateManager:
         item: any
     ):
         """Append an item to an array field in the event data"""
-        data = self._load_event_data(guild_id, event_id)
-        if array_field_name not in data:
-            data[array_field_name] = []
-        elif not isinstance(data[array_field_name], list):
-            data[array_field_name] = []
-        data[array_field_name].append(item)
-        self._save_event_data(guild_id, event_id, data)
+        key = (guild_id, event_id)
+        with self._key_lock(key):
+            data = self._load(key)
+            items = data.get(array_field_name)
+            if not isinstance(items, list):
+                items = data[array_field_name] = []
+            items.append(item)
+            self._save(key, data)
 
     def update_nested_field(
         self,
@@ -146,23 +234,24 @@ class EventStateManager:
         field_value: any
     ):
         """Update a nested field using dot notation (e.g., 'config.setting.value')"""
-        data = self._load_event_data(guild_id, event_id)
-        
-        # Split the field path by dots
-        path_parts = field_path.split('.')
-        current = data
-        
-        # Navigate to the parent of the final field
-        for part in path_parts[:-1]:
-            if part not in current:
-                current[part] = {}
-            elif not isinstance(current[part], dict):
-                current[part] = {}
-            current = current[part]
-        
-        # Set the final field value
-        current[path_parts[-1]] = field_value
-        self._save_event_data(guild_id, event_id, data)
+        key = (guild_id, event_id)
+        with self._key_lock(key):
+            data = self._load(key)
+
+            # Split the field path by dots
+            path_parts = _split_path(field_path)
+            current = data
+
+            # Navigate to the parent of the final field
+            for part in path_parts[:-1]:
+                child = current.get(part)
+                if not isinstance(child, dict):
+                    child = current[part] = {}
+                current = child
+
+            # Set the final field value
+            current[path_parts[-1]] = field_value
+            self._save(key, data)
 
     def remove_from_array_field(
         self,
@@ -172,28 +261,21 @@ class EventStateManager:
         item_match: dict
     ):
         """Remove items from an array field that match the given criteria"""
-        data = self._load_event_data(guild_id, event_id)
-        
-        if array_field_name not in data or not isinstance(data[array_field_name], list):
-            return
-        
-        original_list = data[array_field_name]
-        new_list = []
-        
-        for item in original_list:
-            if isinstance(item, dict):
-                # Check if all match criteria are satisfied
-                match = True
-                for key, value in item_match.items():
-                    if key not in item or item[key] != value:
-                        match = False
-                        break
-                if not match:
-                    new_list.append(item)
-            else:
-                # For non-dict items, only remove if exact match
-                if item != item_match:
-                    new_list.append(item)
-        
-        data[array_field_name] = new_list
-        self._save_event_data(guild_id, event_id, data)
\ No newline at end of file
+        key = (guild_id, event_id)
+        with self._key_lock(key):
+            data = self._load(key)
+
+            items = data.get(array_field_name)
+            if not isinstance(items, list):
+                return
+
+            # Dict items match when they contain every key/value of item_match; the
+            # items-view subset test runs in C instead of a per-key Python loop
+            match_items = item_match.items()
+            new_list = [
+                item for item in items
+                if not (item.items() >= match_items if isinstance(item, dict) else item == item_match)
+            ]
+
+            data[array_field_name] = new_list
+            self._save(key, data)
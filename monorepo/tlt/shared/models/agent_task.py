@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TaskStatus(str, Enum):
@@ -36,6 +36,7 @@ class MessagePriority(str, Enum):
 
 class DiscordContext(BaseModel):
     """Discord-specific context"""
+    model_config = ConfigDict(defer_build=True)
     guild_id: Optional[str] = None
     channel_id: Optional[str] = None
     user_id: Optional[str] = None
@@ -45,6 +46,7 @@ class DiscordContext(BaseModel):
 
 class TimerContext(BaseModel):
     """Timer-specific context"""
+    model_config = ConfigDict(defer_build=True)
     timer_type: str  # "1_day_before", "day_of", "event_time", "followup"
     event_id: str
     scheduled_time: datetime
@@ -52,6 +54,7 @@ class TimerContext(BaseModel):
 
 class EventContext(BaseModel):
     """Context information about an event"""
+    model_config = ConfigDict(defer_build=True)
     event_id: str
     event_title: str
     event_description: Optional[str] = None
@@ -65,6 +68,7 @@ class EventContext(BaseModel):
 
 class AgentTask(BaseModel):
     """Represents a task for the ambient event agent - enhanced to support direct IncomingEvent conversion"""
+    model_config = ConfigDict(defer_build=True)
     
     # Core task fields (from TLT Service)
     task_id: str = Field(..., description="Unique task identifier")
@@ -73,7 +77,7 @@ class AgentTask(BaseModel):
     priority: str = Field("normal", description="Task priority level")
     status: TaskStatus = Field(TaskStatus.PENDING, description="Current task status")
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Task creation timestamp")
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Last update timestamp")
+    updated_at: datetime = Field(default_factory=lambda data: data.get("created_at") or datetime.now(timezone.utc), description="Last update timestamp")
     result: Optional[Dict[str, Any]] = Field(None, description="Task execution result")
     error: Optional[str] = Field(None, description="Error message if task failed")
     
@@ -81,7 +85,7 @@ class AgentTask(BaseModel):
     event_id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Event identifier for IncomingEvent")
     trigger_type: EventTriggerType = Field(EventTriggerType.CLOUDEVENT, description="Event trigger type")
     message_priority: MessagePriority = Field(MessagePriority.NORMAL, description="Message priority")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Event timestamp")
+    timestamp: datetime = Field(default_factory=lambda data: data.get("created_at") or datetime.now(timezone.utc), description="Event timestamp")
     
     # Context fields (optional)
     discord_context: Optional[DiscordContext] = Field(None, description="Discord-specific context")
@@ -91,12 +95,6 @@ class AgentTask(BaseModel):
     # Metadata field for additional data
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     
-    class Config:
-        """Pydantic configuration"""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-        
     def mark_processing(self) -> None:
         """Mark task as processing"""
         self.status = TaskStatus.PROCESSING
@@ -115,26 +113,8 @@ class AgentTask(BaseModel):
         self.updated_at = datetime.now(timezone.utc)
         
     def to_dict(self) -> Dict[str, Any]:
-        """Convert task to dictionary"""
-        return {
-            "task_id": self.task_id,
-            "task_type": self.task_type,
-            "data": self.data,
-            "priority": self.priority,
-            "status": self.status.value,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-            "result": self.result,
-            "error": self.error,
-            "event_id": self.event_id,
-            "trigger_type": self.trigger_type.value,
-            "message_priority": self.message_priority.value,
-            "timestamp": self.timestamp.isoformat(),
-            "discord_context": self.discord_context.dict() if self.discord_context else None,
-            "timer_context": self.timer_context.dict() if self.timer_context else None,
-            "event_context": self.event_context.dict() if self.event_context else None,
-            "metadata": self.metadata
-        }
+        """Convert task to a JSON-ready dictionary"""
+        return self.model_dump(mode="json")
     
     def to_incoming_event_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format expected by IncomingEvent"""
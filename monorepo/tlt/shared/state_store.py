@@ -0,0 +1,286 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager, suppress
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Type, TypeVar
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+
+T = TypeVar("T", bound=BaseModel)
+
+# (guild_id, event_id) for events, (guild_id, event_id, user_id) for users
+_Key = Tuple[str, ...]
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model_class: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model_class])
+
+
+def _loads(raw: bytes) -> dict:
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _dumps(data: dict) -> bytes:
+    # Model entries arrive JSON-ready (model_dump(mode="json")); default=str only
+    # covers odd values handed to the free-form field setters
+    if orjson:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, default=str).encode("utf-8")
+
+
+def _validate_entries(model_class: Type[T], entries: List[dict], construct: bool) -> List[T]:
+    # construct=True skips validation (model_construct) for callers that trust the files
+    if construct:
+        return [model_class.model_construct(**entry) for entry in entries]
+    return _list_adapter(model_class).validate_python(entries)
+
+
+class _FileStateStore:
+    """Cached JSON documents at <root_dir>/<key parts...>/<file name>
+
+    Shared machinery behind EventStateManager and UserStateManager, which differ
+    only in their key (guild/event vs guild/event/user) and what they layer on top.
+    """
+
+    # Number of files whose parsed data is kept in memory
+    CACHE_SIZE = 256
+    # Document file name, and the field seeded with the last key part in a new document
+    _file_name = "state.json"
+    _id_field = "id"
+
+    def __init__(self, root_dir: str):
+        self.root_dir = Path(root_dir)
+        # Hot paths build plain string paths; Path objects cost an allocation per join
+        self._root = str(self.root_dir)
+        # key -> (data, (mtime_ns, size) of the file it mirrors)
+        self._cache: "OrderedDict[_Key, Tuple[dict, Optional[Tuple[int, int]]]]" = OrderedDict()
+        self._dirty: Set[_Key] = set()
+        self._transactions: Dict[_Key, int] = {}
+        # Keys in an open transaction whose file has been checked and loaded once;
+        # later loads in that transaction are served from memory
+        self._txn_loaded: Set[_Key] = set()
+        # key -> {(model_key, identifier_field): (entry list, {identifier value: position}, entries indexed)}
+        self._indexes: Dict[_Key, Dict[Tuple[str, str], tuple]] = {}
+        # One lock per document serializes its reads, writes and transactions, so
+        # work on different documents (fsyncs included) runs in parallel.
+        # _state_lock only guards the shared bookkeeping above and is never held
+        # across file I/O; take a key lock first, never the other way round.
+        self._key_locks: Dict[_Key, threading.RLock] = {}
+        self._state_lock = threading.Lock()
+        # Directories already created, so loads and saves skip the mkdir syscalls
+        self._dirs_ready: Set[str] = set()
+
+    def _key_lock(self, key: _Key) -> threading.RLock:
+        lock = self._key_locks.get(key)
+        if lock is None:
+            with self._state_lock:
+                lock = self._key_locks.setdefault(key, threading.RLock())
+        return lock
+
+    def _get_dir(self, key: _Key) -> str:
+        path = os.path.join(self._root, *key)
+        if path not in self._dirs_ready:
+            os.makedirs(path, exist_ok=True)
+            self._dirs_ready.add(path)
+        return path
+
+    def _get_file(self, key: _Key) -> str:
+        return os.path.join(self._get_dir(key), self._file_name)
+
+    def _forget(self, key: _Key):
+        with self._state_lock:
+            self._cache.pop(key, None)
+            self._indexes.pop(key, None)
+
+    def _entry_position(
+        self,
+        key: _Key,
+        model_key: str,
+        entries: List[dict],
+        identifier_field: str,
+        identifier_value
+    ) -> int:
+        """Position of the first entry whose identifier_field matches, or -1
+
+        The hash index is kept per cached entry list and only extended over
+        entries appended since it was built; a replaced list gets a fresh index.
+        """
+        with self._state_lock:
+            indexes = self._indexes.setdefault(key, {})
+        index = indexes.get((model_key, identifier_field))
+        if index is None or index[0] is not entries:
+            index = (entries, {}, 0)
+        positions = index[1]
+        record = positions.setdefault
+        for i in range(index[2], len(entries)):
+            record(entries[i].get(identifier_field), i)
+        indexes[(model_key, identifier_field)] = (entries, positions, len(entries))
+        return positions.get(identifier_value, -1)
+
+    def _remember(self, key: _Key, data: dict, stamp: Optional[Tuple[int, int]]):
+        with self._state_lock:
+            self._cache[key] = (data, stamp)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.CACHE_SIZE:
+                for old_key in list(self._cache):
+                    if len(self._cache) <= self.CACHE_SIZE:
+                        break
+                    if old_key not in self._dirty and old_key not in self._transactions:
+                        self._cache.pop(old_key)
+                        self._indexes.pop(old_key, None)
+
+    def _decode(self, raw: bytes) -> dict:
+        return _loads(raw)
+
+    def _encode(self, data: dict) -> bytes:
+        return _dumps(data)
+
+    def _load_missing(self, key: _Key, path: str) -> dict:
+        return {self._id_field: key[-1]}
+
+    def _load(self, key: _Key) -> dict:
+        with self._key_lock(key):
+            cached = self._cache.get(key)
+            if cached is not None and key in self._txn_loaded:
+                return cached[0]
+
+            path = self._get_file(key)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                data = self._load_missing(key, path)
+                self._remember(key, data, None)
+                self._mark_loaded(key)
+                return data
+
+            # Another manager (or process) may have written the file since it was cached
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            if cached is not None and cached[1] == stamp:
+                with self._state_lock:
+                    if key in self._cache:
+                        self._cache.move_to_end(key)
+                self._mark_loaded(key)
+                return cached[0]
+
+            with open(path, "rb") as f:
+                data = self._decode(f.read())
+            self._remember(key, data, stamp)
+            self._mark_loaded(key)
+            return data
+
+    def _mark_loaded(self, key: _Key):
+        with self._state_lock:
+            if key in self._transactions:
+                self._txn_loaded.add(key)
+
+    def _write(self, key: _Key, data: dict, fsync: bool = False):
+        """Write to a temp file and os.replace() it over the document, so readers never see a partial file
+
+        Callers hold the key's lock.
+        """
+        path = self._get_file(key)
+        tmp_file = f"{path}.{os.getpid()}.tmp"
+        payload = self._encode(data)
+        try:
+            with open(tmp_file, "wb") as f:
+                f.write(payload)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_file, path)
+        except BaseException:
+            self._forget(key)
+            self._dirs_ready.discard(os.path.dirname(path))
+            with suppress(FileNotFoundError):
+                os.unlink(tmp_file)
+            raise
+        stat = os.stat(path)
+        self._remember(key, data, (stat.st_mtime_ns, stat.st_size))
+
+    def _save(self, key: _Key, data: dict, fsync: bool = False):
+        with self._key_lock(key):
+            if key in self._transactions:
+                self._remember(key, data, self._cache.get(key, (None, None))[1])
+                with self._state_lock:
+                    self._dirty.add(key)
+                    self._txn_loaded.add(key)
+                return
+            self._write(key, data, fsync=fsync)
+
+    @contextmanager
+    def _transaction(self, key: _Key, fsync: bool):
+        with self._key_lock(key):
+            with self._state_lock:
+                self._transactions[key] = self._transactions.get(key, 0) + 1
+            committed = False
+            try:
+                yield self
+                committed = True
+            finally:
+                with self._state_lock:
+                    depth = self._transactions.pop(key) - 1
+                    if depth:
+                        self._transactions[key] = depth
+                        dirty = False
+                    else:
+                        self._txn_loaded.discard(key)
+                        dirty = key in self._dirty
+                        self._dirty.discard(key)
+                if dirty:
+                    if committed:
+                        self._write(key, self._cache[key][0], fsync=fsync)
+                    else:
+                        self._forget(key)
+
+    def _update_stored_entry(
+        self,
+        key: _Key,
+        model_key: str,
+        identifier_field: str,
+        identifier_value,
+        updated_entry: dict
+    ) -> bool:
+        """Replace the first matching entry in the document's model list; False if none matched"""
+        with self._key_lock(key):
+            data = self._load(key)
+            entries = data.get(model_key, [])
+            i = self._entry_position(key, model_key, entries, identifier_field, identifier_value)
+            if i < 0:
+                return False
+            entries[i] = updated_entry
+            self._save(key, data)
+            return True
+
+    def _delete_stored_entries(
+        self,
+        key: _Key,
+        model_key: str,
+        identifier_field: str,
+        identifier_value
+    ) -> bool:
+        """Remove every matching entry from the document's model list; False if none matched"""
+        with self._key_lock(key):
+            data = self._load(key)
+            original_list = data.get(model_key, [])
+            if self._entry_position(key, model_key, original_list, identifier_field, identifier_value) < 0:
+                return False
+
+            # Order-preserving removal of every match; the new list gets a fresh index
+            data[model_key] = [
+                entry for entry in original_list
+                if entry.get(identifier_field) != identifier_value
+            ]
+            self._save(key, data)
+            return True
+
+    def _stored_model_types(self, key: _Key) -> List[str]:
+        data = self._load(key)
+        return [k for k in data.keys() if k != self._id_field]
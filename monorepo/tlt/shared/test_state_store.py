@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Tests for the cached file store behind EventStateManager and UserStateManager"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from tlt.shared.event_state_manager import EventStateManager
+
+
+def _write_externally(root_dir: str, guild_id: str, event_id: str, data: dict):
+    """Rewrite event.json the way other services do, bypassing the manager"""
+    event_file = os.path.join(root_dir, guild_id, event_id, "event.json")
+    with open(event_file, "w") as f:
+        json.dump(data, f, indent=2)
+    # Make sure the stat stamp moves even on coarse-mtime filesystems
+    stat = os.stat(event_file)
+    os.utime(event_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_transaction_sees_external_write():
+    """A transaction starts from the file on disk, not a stale cached copy"""
+    with tempfile.TemporaryDirectory() as root_dir:
+        manager = EventStateManager(root_dir)
+        manager.update_event_field("g1", "e1", "a", 1)
+
+        _write_externally(root_dir, "g1", "e1", {
+            "event_id": "e1",
+            "a": 1,
+            "event_manager_data": {"title": "Written by the event manager service"}
+        })
+
+        with manager.transaction("g1", "e1"):
+            manager.update_nested_field("g1", "e1", "photo_collection.activated", True)
+            manager.update_nested_field("g1", "e1", "photo_collection.admin_user_id", "u1")
+
+        with open(os.path.join(root_dir, "g1", "e1", "event.json")) as f:
+            stored = json.load(f)
+        assert stored["event_manager_data"] == {"title": "Written by the event manager service"}
+        assert stored["photo_collection"] == {"activated": True, "admin_user_id": "u1"}
+
+
+def test_transaction_discards_changes_on_error():
+    """Pending changes are dropped when the transaction block raises"""
+    with tempfile.TemporaryDirectory() as root_dir:
+        manager = EventStateManager(root_dir)
+        manager.update_event_field("g1", "e1", "a", 1)
+
+        try:
+            with manager.transaction("g1", "e1"):
+                manager.update_event_field("g1", "e1", "a", 2)
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        with open(os.path.join(root_dir, "g1", "e1", "event.json")) as f:
+            assert json.load(f)["a"] == 1
+        assert manager.list_model_types("g1", "e1") == ["a"]
+
+
+def test_transaction_does_not_block_other_events():
+    """An open transaction only holds its own event; other events stay writable"""
+    with tempfile.TemporaryDirectory() as root_dir:
+        manager = EventStateManager(root_dir)
+        writer = threading.Thread(target=manager.update_event_field, args=("g1", "e2", "a", 1))
+
+        with manager.transaction("g1", "e1"):
+            manager.update_event_field("g1", "e1", "a", 1)
+            writer.start()
+            writer.join(timeout=5)
+            assert not writer.is_alive()
+
+        with open(os.path.join(root_dir, "g1", "e2", "event.json")) as f:
+            assert json.load(f)["a"] == 1
+
+
+def test_rolled_back_transaction_never_reaches_disk():
+    """An update racing a transaction on another thread never saves the rolled-back changes"""
+    with tempfile.TemporaryDirectory() as root_dir:
+        manager = EventStateManager(root_dir)
+        manager.update_event_field("g1", "e1", "b", 1)
+
+        # Hold the writer between its load and its save while the main thread
+        # runs a transaction; the wait times out if the writer keeps the event locked
+        loaded = threading.Event()
+        release = threading.Event()
+        save = manager._save
+
+        def paused_save(key, data, fsync=False):
+            if threading.current_thread() is writer:
+                loaded.set()
+                release.wait(timeout=0.5)
+            save(key, data, fsync)
+
+        manager._save = paused_save
+        writer = threading.Thread(target=manager.update_event_field, args=("g1", "e1", "b", 2))
+        writer.start()
+        assert loaded.wait(timeout=5)
+
+        try:
+            with manager.transaction("g1", "e1"):
+                manager.update_event_field("g1", "e1", "a", 1)
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+        release.set()
+        writer.join(timeout=5)
+
+        with open(os.path.join(root_dir, "g1", "e1", "event.json")) as f:
+            assert json.load(f) == {"event_id": "e1", "b": 2}
+
+
+if __name__ == "__main__":
+    test_transaction_sees_external_write()
+    test_transaction_discards_changes_on_error()
+    test_transaction_does_not_block_other_events()
+    test_rolled_back_transaction_never_reaches_disk()
+    print("✅ state store tests passed")
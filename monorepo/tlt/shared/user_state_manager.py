@@ -1,31 +1,53 @@
+import asyncio
 import json
+import os
+from contextlib import suppress
 from pathlib import Path
-from typing import Optional, Type, TypeVar, List
+from typing import List, Type
 from pydantic import BaseModel
 
-T = TypeVar("T", bound=BaseModel)
-
-
-class UserStateManager:
-    def __init__(self, root_dir: str):
-        self.root_dir = Path(root_dir)
-
-    def _get_user_file(self, guild_id: str, event_id: str, user_id: str) -> Path:
-        path = self.root_dir / guild_id / event_id / user_id
-        path.mkdir(parents=True, exist_ok=True)
-        return path / "user.json"
-
-    def _load_user_data(self, guild_id: str, event_id: str, user_id: str) -> dict:
-        user_file = self._get_user_file(guild_id, event_id, user_id)
-        if not user_file.exists():
-            return {"user_id": user_id}
-        with user_file.open("r", encoding="utf-8") as f:
-            return json.load(f)
-
-    def _save_user_data(self, guild_id: str, event_id: str, user_id: str, data: dict):
-        user_file = self._get_user_file(guild_id, event_id, user_id)
-        with user_file.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+from tlt.shared.state_store import T, _FileStateStore, _loads, _validate_entries, orjson
+
+
+def _dumps_line(entry: dict) -> bytes:
+    if orjson:
+        return orjson.dumps(entry, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(entry, default=str).encode("utf-8") + b"\n"
+
+
+class UserStateManager(_FileStateStore):
+    # Number of user files whose parsed data is kept in memory
+    CACHE_SIZE = 1024
+    _file_name = "user.json"
+    _id_field = "user_id"
+
+    def _get_model_log(self, guild_id: str, event_id: str, user_id: str, model_key: str) -> str:
+        return os.path.join(self._get_dir((guild_id, event_id, user_id)), f"{model_key}.jsonl")
+
+    def _read_model_log(self, guild_id: str, event_id: str, user_id: str, model_key: str) -> List[dict]:
+        log_file = self._get_model_log(guild_id, event_id, user_id, model_key)
+        try:
+            with open(log_file, "rb") as f:
+                return [_loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def _write_model_log(self, guild_id: str, event_id: str, user_id: str, model_key: str, entries: List[dict]):
+        log_file = self._get_model_log(guild_id, event_id, user_id, model_key)
+        tmp_file = f"{log_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, "wb") as f:
+                f.write(b"".join(_dumps_line(entry) for entry in entries))
+            os.replace(tmp_file, log_file)
+        except BaseException:
+            self._dirs_ready.discard(os.path.dirname(log_file))
+            with suppress(FileNotFoundError):
+                os.unlink(tmp_file)
+            raise
+
+    # Model entries are kept in an append-only <ModelName>.jsonl next to user.json,
+    # so recording a result is one appended line instead of a full user.json rewrite.
+    # Lists already stored inside user.json are still read, updated and deleted in place.
 
     def add_model_entry(
         self,
@@ -34,23 +56,47 @@ class UserStateManager:
         user_id: str,
         model_instance: BaseModel
     ):
-        data = self._load_user_data(guild_id, event_id, user_id)
         model_key = model_instance.__class__.__name__
-        model_list = data.setdefault(model_key, [])
-        model_list.append(model_instance.model_dump())
-        self._save_user_data(guild_id, event_id, user_id, data)
+        line = _dumps_line(model_instance.model_dump(mode="json"))
+        key = (guild_id, event_id, user_id)
+        with self._key_lock(key):
+            log_file = self._get_model_log(guild_id, event_id, user_id, model_key)
+            try:
+                with open(log_file, "ab") as f:
+                    f.write(line)
+            except FileNotFoundError:
+                # The directory was removed behind our back; recreate it on the next call
+                self._dirs_ready.discard(os.path.dirname(log_file))
+                raise
+
+    async def add_model_entry_async(
+        self,
+        guild_id: str,
+        event_id: str,
+        user_id: str,
+        model_instance: BaseModel
+    ):
+        """add_model_entry() on a worker thread, so coroutine callers don't block the event loop on the append"""
+        await asyncio.to_thread(self.add_model_entry, guild_id, event_id, user_id, model_instance)
 
     def list_model_entries(
         self,
         guild_id: str,
         event_id: str,
         user_id: str,
-        model_class: Type[T]
+        model_class: Type[T],
+        construct: bool = False
     ) -> List[T]:
-        data = self._load_user_data(guild_id, event_id, user_id)
+        """List stored entries as model_class instances
+
+        construct=True skips validation (model_construct) for callers that trust the files.
+        """
         model_key = model_class.__name__
-        entries = data.get(model_key, [])
-        return [model_class(**entry) for entry in entries]
+        key = (guild_id, event_id, user_id)
+        with self._key_lock(key):
+            data = self._load(key)
+            entries = data.get(model_key, []) + self._read_model_log(guild_id, event_id, user_id, model_key)
+        return _validate_entries(model_class, entries, construct)
 
     def update_model_entry(
         self,
@@ -60,26 +106,28 @@ class UserStateManager:
         model_instance: BaseModel,
         identifier_field: str
     ):
-        data = self._load_user_data(guild_id, event_id, user_id)
         model_key = model_instance.__class__.__name__
         identifier_value = getattr(model_instance, identifier_field)
-
-        entries = data.get(model_key, [])
-        updated = False
-
-        for i, entry in enumerate(entries):
-            if entry.get(identifier_field) == identifier_value:
-                entries[i] = model_instance.model_dump()
-                updated = True
-                break
-
-        if not updated:
-            raise ValueError(
-                f"No entry with {identifier_field}={identifier_value} found in {model_key}."
-            )
-
-        data[model_key] = entries
-        self._save_user_data(guild_id, event_id, user_id, data)
+        updated_entry = model_instance.model_dump(mode="json")
+        key = (guild_id, event_id, user_id)
+
+        with self._key_lock(key):
+            if self._update_stored_entry(
+                key, model_key, identifier_field, identifier_value, updated_entry
+            ):
+                return
+
+            # Logs are re-read on every call, so they are scanned rather than indexed
+            log_entries = self._read_model_log(guild_id, event_id, user_id, model_key)
+            for i in range(len(log_entries)):
+                if log_entries[i].get(identifier_field) == identifier_value:
+                    log_entries[i] = updated_entry
+                    self._write_model_log(guild_id, event_id, user_id, model_key, log_entries)
+                    return
+
+        raise ValueError(
+            f"No entry with {identifier_field}={identifier_value} found in {model_key}."
+        )
 
     def delete_model_entry(
         self,
@@ -90,27 +138,38 @@ class UserStateManager:
         identifier_field: str,
         identifier_value: str
     ):
-        data = self._load_user_data(guild_id, event_id, user_id)
         model_key = model_class.__name__
-        original_list = data.get(model_key, [])
-        new_list = [
-            entry for entry in original_list
-            if entry.get(identifier_field) != identifier_value
-        ]
+        key = (guild_id, event_id, user_id)
+
+        with self._key_lock(key):
+            deleted = self._delete_stored_entries(
+                key, model_key, identifier_field, identifier_value
+            )
 
-        if len(new_list) == len(original_list):
+            original_log = self._read_model_log(guild_id, event_id, user_id, model_key)
+            new_log = [
+                entry for entry in original_log
+                if entry.get(identifier_field) != identifier_value
+            ]
+            if len(new_log) != len(original_log):
+                self._write_model_log(guild_id, event_id, user_id, model_key, new_log)
+                deleted = True
+
+        if not deleted:
             raise ValueError(
                 f"No entry with {identifier_field}={identifier_value} found in {model_key}."
             )
 
-        data[model_key] = new_list
-        self._save_user_data(guild_id, event_id, user_id, data)
-
     def list_model_types(
         self,
         guild_id: str,
         event_id: str,
         user_id: str
     ) -> List[str]:
-        data = self._load_user_data(guild_id, event_id, user_id)
-        return [k for k in data.keys() if k != "user_id"]
\ No newline at end of file
+        key = (guild_id, event_id, user_id)
+        model_types = self._stored_model_types(key)
+        user_dir = Path(self._get_dir(key))
+        for log_file in sorted(user_dir.glob("*.jsonl")):
+            if log_file.stem not in model_types:
+                model_types.append(log_file.stem)
+        return model_types